@@ -1,106 +1,140 @@
 """アプリアイコン生成スクリプト"""
 
+from functools import lru_cache
 from PIL import Image, ImageDraw, ImageFont
 import math
 
+# 矢印の円弧角度（度）
+ARC_START, ARC_END = -60, 150
+ARC_START2, ARC_END2 = 120, 330
+
+# 円弧終点の cos/sin（事前計算）
+_END_COS, _END_SIN = math.cos(math.radians(ARC_END)), math.sin(math.radians(ARC_END))
+_END_COS2, _END_SIN2 = math.cos(math.radians(ARC_END2)), math.sin(math.radians(ARC_END2))
+
+
+@lru_cache(maxsize=None)
+def _load_font(font_size):
+    """フォントを読み込み（同じサイズは再読み込みしない）"""
+    try:
+        return ImageFont.truetype("arial.ttf", font_size)
+    except OSError:
+        # フォントが見つからない環境ではデフォルトフォントを使用
+        return ImageFont.load_default()
+
+
+def _annular_sector(cx, cy, outer_r, inner_r, start, end, steps):
+    """
+    円弧（太線）と同じ形の扇形リングの頂点を生成
+
+    Args:
+        cx, cy: 中心座標
+        outer_r: 外側の半径
+        inner_r: 内側の半径
+        start, end: 開始・終了角度（度、draw.arc と同じ向き）
+        steps: 円弧の分割数
+
+    Returns:
+        draw.polygon に渡す頂点座標のフラットなリスト [x0, y0, x1, y1, ...]
+    """
+    a0 = math.radians(start)
+    step = (math.radians(end) - a0) / (steps - 1)
+    # 外周・内周で同じ cos/sin の表を使う
+    cos_sin = [(math.cos(a0 + step * i), math.sin(a0 + step * i)) for i in range(steps)]
+
+    points = []
+    for c, s in cos_sin:
+        points += (cx + outer_r * c, cy + outer_r * s)
+    for c, s in reversed(cos_sin):
+        points += (cx + inner_r * c, cy + inner_r * s)
+    return points
+
 
 def create_icon():
     """Python AutoUpdate用のアイコンを作成"""
     sizes = [256, 128, 64, 48, 32, 16]
-    images = []
-
-    for size in sizes:
-        img = Image.new('RGBA', (size, size), (0, 0, 0, 0))
-        draw = ImageDraw.Draw(img)
-
-        # 背景円（ダークブルー）
-        padding = size // 16
-        draw.ellipse(
-            [padding, padding, size - padding, size - padding],
-            fill='#1E293B'
-        )
-
-        # 中心点
-        cx, cy = size // 2, size // 2
-        radius = size // 2 - padding * 2
-
-        # 更新矢印を描画（円形の矢印）
-        arrow_width = max(2, size // 16)
-
-        # 上部の円弧矢印
-        arc_radius = radius * 0.55
-        arc_start = -60
-        arc_end = 150
-
-        # 円弧を描画
-        arc_bbox = [
-            cx - arc_radius, cy - arc_radius,
-            cx + arc_radius, cy + arc_radius
-        ]
-        draw.arc(arc_bbox, arc_start, arc_end, fill='#38BDF8', width=arrow_width)
-
-        # 矢印の先端（三角形）
-        arrow_size = max(4, size // 10)
-        # 円弧の終点に矢印を配置
-        end_angle = math.radians(arc_end)
-        arrow_x = cx + arc_radius * math.cos(end_angle)
-        arrow_y = cy + arc_radius * math.sin(end_angle)
-
-        # 矢印の三角形を描画
-        triangle_points = [
-            (arrow_x + arrow_size * 0.8, arrow_y - arrow_size * 0.3),
-            (arrow_x - arrow_size * 0.3, arrow_y - arrow_size * 0.8),
-            (arrow_x - arrow_size * 0.3, arrow_y + arrow_size * 0.5),
-        ]
-        draw.polygon(triangle_points, fill='#38BDF8')
-
-        # 下部の円弧矢印（反対方向）
-        arc_start2 = 120
-        arc_end2 = 330
-
-        draw.arc(arc_bbox, arc_start2, arc_end2, fill='#7DD3FC', width=arrow_width)
-
-        # 下の矢印の先端
-        end_angle2 = math.radians(arc_end2)
-        arrow_x2 = cx + arc_radius * math.cos(end_angle2)
-        arrow_y2 = cy + arc_radius * math.sin(end_angle2)
-
-        triangle_points2 = [
-            (arrow_x2 - arrow_size * 0.8, arrow_y2 + arrow_size * 0.3),
-            (arrow_x2 + arrow_size * 0.3, arrow_y2 + arrow_size * 0.8),
-            (arrow_x2 + arrow_size * 0.3, arrow_y2 - arrow_size * 0.5),
-        ]
-        draw.polygon(triangle_points2, fill='#7DD3FC')
-
-        # 中央にPythonの "Py" テキスト（大きいサイズのみ）
-        if size >= 48:
-            try:
-                font_size = size // 4
-                font = ImageFont.truetype("arial.ttf", font_size)
-            except:
-                font = ImageFont.load_default()
-
-            text = "Py"
-            bbox = draw.textbbox((0, 0), text, font=font)
-            text_width = bbox[2] - bbox[0]
-            text_height = bbox[3] - bbox[1]
-            text_x = cx - text_width // 2
-            text_y = cy - text_height // 2
-            draw.text((text_x, text_y), text, fill='#E0F2FE', font=font)
-
-        images.append(img)
-
-    # ICOファイルとして保存
-    images[0].save(
+
+    # 最大サイズで一度だけ描画し、小さいサイズは縮小で生成する
+    size = sizes[0]
+    img = Image.new('RGBA', (size, size), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(img)
+
+    # 背景円（ダークブルー）
+    padding = size // 16
+    draw.ellipse(
+        [padding, padding, size - padding, size - padding],
+        fill='#1E293B'
+    )
+
+    # 中心点
+    cx, cy = size // 2, size // 2
+    radius = size // 2 - padding * 2
+
+    # 更新矢印を描画（円形の矢印）
+    arrow_width = max(2, size // 16)
+
+    # 上部の円弧矢印
+    arc_radius = radius * 0.55
+
+    # 円弧を描画（太線の arc は遅いので塗りつぶしポリゴンで描く）
+    arc_steps = max(12, size // 4)
+    draw.polygon(
+        _annular_sector(cx, cy, arc_radius, arc_radius - arrow_width, ARC_START, ARC_END, arc_steps),
+        fill='#38BDF8'
+    )
+
+    # 矢印の先端（三角形）
+    arrow_size = max(4, size // 10)
+    # 円弧の終点に矢印を配置
+    arrow_x = cx + arc_radius * _END_COS
+    arrow_y = cy + arc_radius * _END_SIN
+
+    # 矢印の三角形を描画
+    triangle_points = [
+        (arrow_x + arrow_size * 0.8, arrow_y - arrow_size * 0.3),
+        (arrow_x - arrow_size * 0.3, arrow_y - arrow_size * 0.8),
+        (arrow_x - arrow_size * 0.3, arrow_y + arrow_size * 0.5),
+    ]
+    draw.polygon(triangle_points, fill='#38BDF8')
+
+    # 下部の円弧矢印（反対方向）
+    draw.polygon(
+        _annular_sector(cx, cy, arc_radius, arc_radius - arrow_width, ARC_START2, ARC_END2, arc_steps),
+        fill='#7DD3FC'
+    )
+
+    # 下の矢印の先端
+    arrow_x2 = cx + arc_radius * _END_COS2
+    arrow_y2 = cy + arc_radius * _END_SIN2
+
+    triangle_points2 = [
+        (arrow_x2 - arrow_size * 0.8, arrow_y2 + arrow_size * 0.3),
+        (arrow_x2 + arrow_size * 0.3, arrow_y2 + arrow_size * 0.8),
+        (arrow_x2 + arrow_size * 0.3, arrow_y2 - arrow_size * 0.5),
+    ]
+    draw.polygon(triangle_points2, fill='#7DD3FC')
+
+    # 中央にPythonの "Py" テキスト（小さいサイズは縮小結果に任せる）
+    font = _load_font(size // 4)
+
+    text = "Py"
+    bbox = draw.textbbox((0, 0), text, font=font)
+    text_width = bbox[2] - bbox[0]
+    text_height = bbox[3] - bbox[1]
+    text_x = cx - text_width // 2
+    text_y = cy - text_height // 2
+    draw.text((text_x, text_y), text, fill='#E0F2FE', font=font)
+
+    # ICOファイルとして保存（小さいサイズはPillowが保存時に縮小）
+    img.save(
         'Python_AutoUpdate/icon.ico',
         format='ICO',
-        sizes=[(s, s) for s in sizes],
-        append_images=images[1:]
+        sizes=[(s, s) for s in sizes]
     )
     print("アイコンを作成しました: Python_AutoUpdate/icon.ico")
 
     # PNGも保存（256x256）
-    images[0].save('Python_AutoUpdate/icon.png', format='PNG')
+    img.save('Python_AutoUpdate/icon.png', format='PNG')
     print("PNGも保存しました: Python_AutoUpdate/icon.png")
 
 
@@ -2,6 +2,7 @@
 
 import ctypes
 import sys
+from ctypes import wintypes
 from pathlib import Path
 
 # srcディレクトリをパスに追加
@@ -11,11 +12,22 @@ sys.path.insert(0, str(src_dir))
 # バージョン情報
 __version__ = "1.1.0"
 
-from PyQt6.QtWidgets import QApplication, QMessageBox
-
 # 多重起動防止用のミューテックス名
 MUTEX_NAME = "PythonAutoUpdate_SingleInstance_Mutex"
 
+ERROR_ALREADY_EXISTS = 183
+
+# kernel32の関数プロトタイプ（型を明示して一度だけ定義）
+_kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+
+_CreateMutexW = _kernel32.CreateMutexW
+_CreateMutexW.argtypes = [ctypes.c_void_p, wintypes.BOOL, wintypes.LPCWSTR]
+_CreateMutexW.restype = wintypes.HANDLE
+
+_CloseHandle = _kernel32.CloseHandle
+_CloseHandle.argtypes = [wintypes.HANDLE]
+_CloseHandle.restype = wintypes.BOOL
+
 
 def check_single_instance() -> bool:
     """
@@ -25,13 +37,11 @@ def check_single_instance() -> bool:
         初回起動ならTrue、既に起動中ならFalse
     """
     # Windows APIでミューテックスを作成
-    kernel32 = ctypes.windll.kernel32
-    mutex = kernel32.CreateMutexW(None, True, MUTEX_NAME)
-    last_error = kernel32.GetLastError()
+    mutex = _CreateMutexW(None, True, MUTEX_NAME)
+    last_error = ctypes.get_last_error()
 
-    # ERROR_ALREADY_EXISTS = 183
-    if last_error == 183:
-        kernel32.CloseHandle(mutex)
+    if last_error == ERROR_ALREADY_EXISTS:
+        _CloseHandle(mutex)
         return False
 
     # ミューテックスのハンドルをグローバルに保持（プロセス終了まで維持）
@@ -45,6 +55,8 @@ def main() -> int:
     # 多重起動チェック
     if not check_single_instance():
         # 既に起動中の場合はメッセージを表示して終了
+        from PyQt6.QtWidgets import QApplication, QMessageBox
+
         app = QApplication(sys.argv)
         QMessageBox.warning(
             None,
@@ -54,13 +66,17 @@ def main() -> int:
         )
         return 1
 
-    # GUI のインポートは実行時に
+    # PyQt6・GUI のインポートは多重起動チェック後に
+    from PyQt6.QtWidgets import QApplication
+
     from gui.main_window_standalone import MainWindow
+    from gui.styles import APP_QSS
 
     app = QApplication(sys.argv)
     app.setApplicationName("Python AutoUpdate")
     app.setApplicationVersion(__version__)
     app.setStyle("Fusion")
+    app.setStyleSheet(APP_QSS)
 
     window = MainWindow()
     window.show()
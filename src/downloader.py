@@ -1,33 +1,98 @@
 """Pythonインストーラーダウンロード機能"""
 
 import hashlib
+import mmap
 import os
+import queue
 import tempfile
+import threading
+import time
+from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, wait
 from pathlib import Path
 from typing import Callable, Optional
 
 import requests
+import urllib3
 
 try:
+    from .http_client import create_session
     from .version_checker import PythonVersion
 except ImportError:
+    from http_client import create_session
     from version_checker import PythonVersion
 
 
+# ダウンロード時の既定の読み込みチャンクサイズ（512KB）
+# raw.read は指定サイズが揃うまで戻らないため、大きくしすぎると進捗通知とキャンセル確認の間隔が空く
+DOWNLOAD_CHUNK_SIZE = 512 * 1024
+
+# インストーラーは圧縮済みのため転送時の圧縮は不要
+_IDENTITY_HEADERS = {'Accept-Encoding': 'identity'}
+
+# セッションを渡されなかった場合の共有セッション（TLSハンドシェイクを使い回す）
+_SESSION = create_session()
+
+
 class DownloadError(Exception):
     """ダウンロードエラー"""
     pass
 
 
+class _RangeNotSupportedError(DownloadError):
+    """Accept-Ranges を返すがRangeリクエストを無視するサーバー（単一ストリームで再取得する）"""
+    pass
+
+
+class _SegmentProgress:
+    """並列ダウンロードの合計受信バイト数（スレッドセーフ）"""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._value = 0
+
+    @property
+    def value(self) -> int:
+        return self._value
+
+    def add(self, size: int) -> None:
+        with self._lock:
+            self._value += size
+
+
 class Downloader:
     """Pythonインストーラーをダウンロードするクラス"""
 
-    # チャンクサイズ（1MB）
-    CHUNK_SIZE = 1024 * 1024
+    # チャンクサイズ（download() の chunk_size 省略時に使用）
+    CHUNK_SIZE = DOWNLOAD_CHUNK_SIZE
 
-    def __init__(self) -> None:
+    # ハッシュ計算時の読み込みサイズ（1MB）
+    HASH_CHUNK_SIZE = 1024 * 1024
+
+    # このサイズを超えるファイルはメモリマップしてハッシュを計算（2MB）
+    MMAP_MIN_SIZE = 2 * 1024 * 1024
+
+    # 進捗コールバックの最小間隔（バイト数・秒）
+    PROGRESS_MIN_BYTES = 256 * 1024
+    PROGRESS_MIN_INTERVAL = 0.05
+
+    # 書き込みスレッドに渡すチャンクの最大待ち数（メモリ使用量は最大でこの数×チャンクサイズ）
+    WRITE_QUEUE_SIZE = 8
+
+    # 並列ダウンロードのセグメント数と、分割する最小ファイルサイズ（8MB）
+    SEGMENT_COUNT = 4
+    SEGMENT_MIN_SIZE = 8 * 1024 * 1024
+
+    def __init__(self, session: Optional[requests.Session] = None) -> None:
+        """
+        Args:
+            session: 使用するHTTPセッション（Noneの場合はモジュール共有のセッション）
+        """
+        self._session = session if session is not None else _SESSION
+        self._chunk_size = self.CHUNK_SIZE
         self._download_path: Optional[Path] = None
         self._is_cancelled = False
+        # ダウンロード中に計算したSHA256（並列ダウンロード時はNone）
+        self._sha256_hex: Optional[str] = None
 
     @property
     def download_path(self) -> Optional[Path]:
@@ -43,7 +108,8 @@ class Downloader:
         url: str,
         version: PythonVersion,
         progress_callback: Optional[Callable[[int, int], None]] = None,
-        save_dir: Optional[Path] = None
+        save_dir: Optional[Path] = None,
+        chunk_size: Optional[int] = None
     ) -> Path:
         """
         Pythonインストーラーをダウンロード
@@ -53,6 +119,7 @@ class Downloader:
             version: ダウンロードするPythonバージョン
             progress_callback: 進捗コールバック (downloaded_bytes, total_bytes)
             save_dir: 保存先ディレクトリ（省略時はtempディレクトリ）
+            chunk_size: 1回に読み込むバイト数（省略時はCHUNK_SIZE）
 
         Returns:
             ダウンロードしたファイルのパス
@@ -61,6 +128,8 @@ class Downloader:
             DownloadError: ダウンロード失敗時
         """
         self._is_cancelled = False
+        self._sha256_hex = None
+        self._chunk_size = chunk_size or self.CHUNK_SIZE
 
         # 保存先ディレクトリを設定
         if save_dir is None:
@@ -70,37 +139,242 @@ class Downloader:
 
         filename = f"python-{version.version_string}-amd64.exe"
         filepath = save_dir / filename
+        # 完了するまでは一時ファイルに書き込み、成功時にリネームする
+        part_path = filepath.with_name(filename + ".part")
 
         try:
-            # ストリーミングダウンロード
-            response = requests.get(url, stream=True, timeout=30)
+            try:
+                # Range対応ならセグメントに分けて並列ダウンロード
+                total_size, accepts_ranges = self._probe(url)
+                if accepts_ranges and total_size >= self.SEGMENT_MIN_SIZE:
+                    try:
+                        self._download_segmented(url, part_path, total_size, progress_callback)
+                    except _RangeNotSupportedError:
+                        self._download_stream(url, part_path, progress_callback)
+                else:
+                    self._download_stream(url, part_path, progress_callback)
+
+                # 置き換え先が使用中（前回のインストーラーが開いたまま等）でも一時ファイルを残さない
+                try:
+                    os.replace(part_path, filepath)
+                except OSError as e:
+                    raise DownloadError(f"ダウンロードしたファイルを保存できませんでした: {e}") from e
+            except BaseException:
+                # キャンセル・失敗時は途中ファイルを削除
+                part_path.unlink(missing_ok=True)
+                raise
+
+            self._download_path = filepath
+            return filepath
+
+        except (requests.RequestException, urllib3.exceptions.HTTPError) as e:
+            raise DownloadError(f"ダウンロードに失敗しました: {e}") from e
+        except (OSError, ValueError) as e:
+            # 並列ダウンロードのセグメントはワーカースレッドで書き込むため、
+            # ファイル操作の失敗はここでまとめて変換する（RequestException も OSError のため後に置く）
+            raise DownloadError(f"ファイルの書き込みに失敗しました: {e}") from e
+
+    def _probe(self, url: str) -> tuple[int, bool]:
+        """
+        HEADリクエストでファイルサイズとRange対応を確認
+
+        Args:
+            url: ダウンロードURL
+
+        Returns:
+            (合計サイズ, Rangeリクエストに対応しているか)
+        """
+        try:
+            response = self._session.head(
+                url, headers=_IDENTITY_HEADERS, timeout=10, allow_redirects=True
+            )
+        except requests.RequestException:
+            return (0, False)
+
+        if not response.ok:
+            return (0, False)
+
+        total_size = int(response.headers.get('content-length', 0))
+        accepts_ranges = response.headers.get('accept-ranges', '').lower() == 'bytes'
+        return (total_size, accepts_ranges)
+
+    def _download_stream(
+        self,
+        url: str,
+        filepath: Path,
+        progress_callback: Optional[Callable[[int, int], None]]
+    ) -> None:
+        """単一ストリームでダウンロード"""
+        with self._session.get(
+            url, headers=_IDENTITY_HEADERS, stream=True, timeout=30
+        ) as response:
             response.raise_for_status()
 
             # 合計サイズを取得
             total_size = int(response.headers.get('content-length', 0))
             downloaded_size = 0
 
-            with open(filepath, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=self.CHUNK_SIZE):
-                    if self._is_cancelled:
-                        # キャンセルされた場合、途中ファイルを削除
-                        f.close()
-                        if filepath.exists():
-                            filepath.unlink()
-                        raise DownloadError("ダウンロードがキャンセルされました")
+            # 進捗通知は一定量・一定時間ごとに間引く
+            report_step = max(total_size // 200, self.PROGRESS_MIN_BYTES)
+            last_reported = 0
+            last_reported_at = time.monotonic()
+
+            # iter_contentのジェネレーターを経由せず生ストリームから直接読む
+            raw = response.raw
+            raw.decode_content = True
 
-                    if chunk:
+            # 書き込みと同時にハッシュを計算し、検証時の再読み込みを省く
+            sha256 = hashlib.sha256()
+
+            # 受信とディスク書き込みを重ねるため、書き込みは別スレッドで行う
+            chunks: queue.Queue[Optional[bytes]] = queue.Queue(maxsize=self.WRITE_QUEUE_SIZE)
+            write_errors: list[OSError] = []
+
+            def write_chunks(f) -> None:
+                while (chunk := chunks.get()) is not None:
+                    if write_errors:
+                        continue  # エラー後は受信側が止まるまで読み捨てる
+                    try:
                         f.write(chunk)
+                        sha256.update(chunk)
+                    except OSError as e:
+                        write_errors.append(e)
+
+            with open(filepath, 'wb') as f:
+                # サイズが分かっていれば先に確保してファイルの断片化を防ぐ
+                if total_size:
+                    f.truncate(total_size)
+
+                writer = threading.Thread(target=write_chunks, args=(f,), daemon=True)
+                writer.start()
+                try:
+                    while chunk := raw.read(self._chunk_size):
+                        if self._is_cancelled:
+                            raise DownloadError("ダウンロードがキャンセルされました")
+                        if write_errors:
+                            break
+
+                        chunks.put(chunk)
                         downloaded_size += len(chunk)
 
                         if progress_callback:
-                            progress_callback(downloaded_size, total_size)
+                            now = time.monotonic()
+                            if (downloaded_size - last_reported >= report_step
+                                    or now - last_reported_at > self.PROGRESS_MIN_INTERVAL):
+                                last_reported = downloaded_size
+                                last_reported_at = now
+                                progress_callback(downloaded_size, total_size)
+                finally:
+                    chunks.put(None)
+                    writer.join()
 
-            self._download_path = filepath
-            return filepath
+            # 最後のチャンクの後（進捗通知中など）にキャンセルされた場合も成功扱いにしない
+            if self._is_cancelled:
+                raise DownloadError("ダウンロードがキャンセルされました")
 
-        except requests.RequestException as e:
-            raise DownloadError(f"ダウンロードに失敗しました: {e}") from e
+            if write_errors:
+                raise DownloadError(f"ファイルの書き込みに失敗しました: {write_errors[0]}") from write_errors[0]
+
+            # 最終サイズを必ず通知
+            if progress_callback and last_reported != downloaded_size:
+                progress_callback(downloaded_size, total_size)
+
+        # 事前確保したサイズに満たない場合は途中で切れている
+        if total_size and downloaded_size != total_size:
+            raise DownloadError(
+                f"ダウンロードが途中で終了しました ({downloaded_size} / {total_size} バイト)"
+            )
+
+        self._sha256_hex = sha256.hexdigest()
+
+    def _download_segmented(
+        self,
+        url: str,
+        filepath: Path,
+        total_size: int,
+        progress_callback: Optional[Callable[[int, int], None]]
+    ) -> None:
+        """Rangeリクエストで複数セグメントを並列ダウンロード"""
+        # 先にファイル全体を確保し、各セグメントは自分の位置に書き込む
+        with open(filepath, 'wb') as f:
+            f.truncate(total_size)
+
+        segment_size = -(-total_size // self.SEGMENT_COUNT)
+        segments = [
+            (start, min(start + segment_size, total_size) - 1)
+            for start in range(0, total_size, segment_size)
+        ]
+
+        progress = _SegmentProgress()
+        abort = threading.Event()
+
+        with ThreadPoolExecutor(max_workers=len(segments)) as executor:
+            pending = {
+                executor.submit(self._download_segment, url, filepath, start, end, progress, abort)
+                for start, end in segments
+            }
+            last_reported = 0
+            try:
+                while pending:
+                    done, pending = wait(
+                        pending,
+                        timeout=self.PROGRESS_MIN_INTERVAL,
+                        return_when=FIRST_EXCEPTION
+                    )
+                    for future in done:
+                        future.result()
+
+                    # 進捗は呼び出し元スレッドからまとめて通知
+                    downloaded_size = progress.value
+                    if progress_callback and downloaded_size != last_reported:
+                        last_reported = downloaded_size
+                        progress_callback(downloaded_size, total_size)
+
+                    # セグメント側はチャンクの読み込み間でしか確認しないため、ここでも確認する
+                    # （最後のチャンクを読み終えた後や進捗通知中のキャンセルを成功扱いにしない）
+                    if self._is_cancelled:
+                        raise DownloadError("ダウンロードがキャンセルされました")
+            except BaseException:
+                # 残りのセグメントも停止させる（途中ファイルは呼び出し元の download() で削除）
+                abort.set()
+                raise
+
+    def _download_segment(
+        self,
+        url: str,
+        filepath: Path,
+        start: int,
+        end: int,
+        progress: "_SegmentProgress",
+        abort: threading.Event
+    ) -> None:
+        """1セグメント分（start〜endバイト）をダウンロード"""
+        headers = {**_IDENTITY_HEADERS, 'Range': f'bytes={start}-{end}'}
+        with self._session.get(url, headers=headers, stream=True, timeout=30) as response:
+            response.raise_for_status()
+            if response.status_code != 206:
+                raise _RangeNotSupportedError("サーバーが部分ダウンロードに対応していません")
+
+            raw = response.raw
+            raw.decode_content = True
+            received = 0
+
+            with open(filepath, 'r+b') as f:
+                f.seek(start)
+                while chunk := raw.read(self._chunk_size):
+                    if self._is_cancelled:
+                        raise DownloadError("ダウンロードがキャンセルされました")
+                    if abort.is_set():
+                        return
+
+                    f.write(chunk)
+                    received += len(chunk)
+                    progress.add(len(chunk))
+
+        if received != end - start + 1:
+            raise DownloadError(
+                f"ダウンロードが途中で終了しました ({start + received} / {end + 1} バイト)"
+            )
 
     def verify_download(self, filepath: Path, expected_hash: Optional[str] = None) -> bool:
         """
@@ -117,16 +391,30 @@ class Downloader:
             return False
 
         # ファイルサイズが0より大きいことを確認
-        if filepath.stat().st_size == 0:
+        file_size = filepath.stat().st_size
+        if file_size == 0:
             return False
 
         # ハッシュが指定されている場合は検証
         if expected_hash:
-            sha256 = hashlib.sha256()
+            # ダウンロード時に計算済みならファイルを読み直さない
+            if self._sha256_hex and filepath == self._download_path:
+                return self._sha256_hex == expected_hash.lower()
+
             with open(filepath, 'rb') as f:
-                for chunk in iter(lambda: f.read(8192), b''):
-                    sha256.update(chunk)
-            return sha256.hexdigest().lower() == expected_hash.lower()
+                if file_size > self.MMAP_MIN_SIZE:
+                    # 大きいファイルはメモリマップして一回の呼び出しで計算
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        digest = hashlib.sha256(mm).hexdigest()
+                elif hasattr(hashlib, 'file_digest'):
+                    # Python 3.11以降はC実装でまとめて計算
+                    digest = hashlib.file_digest(f, 'sha256').hexdigest()
+                else:
+                    sha256 = hashlib.sha256()
+                    for chunk in iter(lambda: f.read(self.HASH_CHUNK_SIZE), b''):
+                        sha256.update(chunk)
+                    digest = sha256.hexdigest()
+            return digest.lower() == expected_hash.lower()
 
         return True
 
@@ -138,3 +426,4 @@ class Downloader:
             except OSError:
                 pass
             self._download_path = None
+            self._sha256_hex = None
@@ -1,12 +1,13 @@
 """メインウィンドウ"""
 
+import threading
+import time
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
-from PyQt6.QtCore import Qt, QThread, pyqtSignal
+from PyQt6.QtCore import QObject, QRunnable, Qt, QThreadPool, QTimer, pyqtSignal
 from PyQt6.QtGui import QFont, QIcon
 from PyQt6.QtWidgets import (
-    QApplication,
     QHBoxLayout,
     QLabel,
     QMainWindow,
@@ -18,53 +19,131 @@ from PyQt6.QtWidgets import (
 )
 
 from .. import __version__
-from ..downloader import DownloadError, Downloader
-from ..installer import InstallError, Installer
-from ..version_checker import PythonVersion, VersionChecker
 
+# requests 等を含むモジュールはウィンドウ表示後の初回使用時に読み込む
+if TYPE_CHECKING:
+    from ..downloader import Downloader
+    from ..installer import Installer
+    from ..version_checker import PythonVersion, VersionChecker
 
-class CheckVersionThread(QThread):
-    """バージョンチェック用スレッド"""
-    finished = pyqtSignal(object, object, bool)  # installed, latest, update_available
-    error = pyqtSignal(str)
+# ダウンロード進捗を画面に反映する間隔（ミリ秒）
+PROGRESS_POLL_INTERVAL_MS = 50
 
-    def __init__(self, checker: VersionChecker) -> None:
+# バイト数をMBに換算する係数
+_BYTES_TO_MB = 1 / (1024 * 1024)
+
+# バージョンチェック結果を再利用する期間（秒）
+CHECK_CACHE_TTL = 10 * 60
+
+
+class VersionCheckRunnable(QRunnable):
+    """バージョンチェック用タスク（QThreadPoolで実行）"""
+
+    class Signals(QObject):
+        finished = pyqtSignal(object, object, bool)  # installed, latest, update_available
+        error = pyqtSignal(str)
+
+    def __init__(self, checker: "VersionChecker", force: bool = False) -> None:
         super().__init__()
         self.checker = checker
+        self.force = force
+        self.signals = self.Signals()
+        self.is_done = False
+        self._cancelled = threading.Event()
+
+    def cancel(self) -> None:
+        """結果を通知しないようにする"""
+        self._cancelled.set()
 
     def run(self) -> None:
         try:
-            installed, latest, update_available = self.checker.check_for_updates()
-            self.finished.emit(installed, latest, update_available)
+            installed, latest, update_available = self.checker.check_for_updates(force=self.force)
+            if not self._cancelled.is_set():
+                self.signals.finished.emit(installed, latest, update_available)
         except Exception as e:
-            self.error.emit(str(e))
+            if not self._cancelled.is_set():
+                self.signals.error.emit(str(e))
+        finally:
+            self.is_done = True
+
 
+class DownloadRunnable(QRunnable):
+    """ダウンロード用タスク（QThreadPoolで実行）"""
 
-class DownloadThread(QThread):
-    """ダウンロード用スレッド"""
-    progress = pyqtSignal(int, int)  # downloaded, total
-    finished = pyqtSignal(str)  # filepath
-    error = pyqtSignal(str)
+    class Signals(QObject):
+        finished = pyqtSignal(str)  # filepath
+        error = pyqtSignal(str)
 
-    def __init__(self, downloader: Downloader, url: str, version: PythonVersion) -> None:
+    def __init__(
+        self,
+        downloader: "Downloader",
+        url: str,
+        version: "PythonVersion",
+        chunk_size: Optional[int] = None
+    ) -> None:
         super().__init__()
         self.downloader = downloader
         self.url = url
         self.version = version
+        self.chunk_size = chunk_size
+        self.signals = self.Signals()
+        self.is_done = False
+        self._cancelled = threading.Event()
+
+        # 最新の進捗 (percent, "xx.x / yy.y MB")。GUI側のタイマーが定期的に読み取る
+        # （タプルの差し替えは1回の代入のため、読み取り側でロックは不要）
+        self.progress_state: Optional[tuple[int, str]] = None
+        self._last_percent = -1
+        # 合計サイズとそのMB表示（最初の進捗通知時に記録）
+        self._total = 0
+        self._mb_total_text = ""
+
+    def cancel(self) -> None:
+        """ダウンロードを中断し、結果を通知しないようにする"""
+        self._cancelled.set()
+        self.downloader.cancel()
 
     def run(self) -> None:
+        from ..downloader import DownloadError
+
         try:
             filepath = self.downloader.download(
                 self.url,
                 self.version,
-                progress_callback=self._on_progress
+                progress_callback=self._on_progress,
+                chunk_size=self.chunk_size
             )
-            self.finished.emit(str(filepath))
+            if not self._cancelled.is_set():
+                self.signals.finished.emit(str(filepath))
         except DownloadError as e:
-            self.error.emit(str(e))
+            if not self._cancelled.is_set():
+                self.signals.error.emit(str(e))
+        except Exception as e:
+            # 例外を run() の外へ出すとアプリが異常終了するため、想定外のものもエラーとして通知
+            if not self._cancelled.is_set():
+                self.signals.error.emit(f"ダウンロードに失敗しました: {e}")
+        finally:
+            self.is_done = True
 
     def _on_progress(self, downloaded: int, total: int) -> None:
-        self.progress.emit(downloaded, total)
+        if self._cancelled.is_set():
+            return
+
+        if not self._total:
+            if total <= 0:
+                return
+            self._total = total
+            self._mb_total_text = f"{total * _BYTES_TO_MB:.1f}"
+
+        # パーセントが変わった時だけ更新（完了時は必ず更新）
+        percent = downloaded * 100 // self._total
+        if percent == self._last_percent and downloaded != self._total:
+            return
+        self._last_percent = percent
+
+        # 表示用の文字列はGUIスレッドではなくここで組み立てる
+        mb_downloaded = downloaded * _BYTES_TO_MB
+        self.progress_state = (percent, f"{mb_downloaded:.1f} / {self._mb_total_text} MB")
 
 
 class MainWindow(QMainWindow):
@@ -72,18 +151,27 @@ class MainWindow(QMainWindow):
 
     def __init__(self) -> None:
         super().__init__()
-        self.checker = VersionChecker()
-        self.downloader = Downloader()
-        self.installer = Installer()
+        # 初回使用時に作成
+        self.checker: Optional["VersionChecker"] = None
+        self.downloader: Optional["Downloader"] = None
+        self.installer: Optional["Installer"] = None
 
-        self._installed_version: Optional[PythonVersion] = None
-        self._latest_version: Optional[PythonVersion] = None
+        self._installed_version: Optional["PythonVersion"] = None
+        self._latest_version: Optional["PythonVersion"] = None
         self._download_url: Optional[str] = None
-        self._check_thread: Optional[CheckVersionThread] = None
-        self._download_thread: Optional[DownloadThread] = None
+        self._check_task: Optional[VersionCheckRunnable] = None
+        self._download_task: Optional[DownloadRunnable] = None
+
+        # 最後にバージョン情報を取得した時刻（time.monotonic()基準）
+        self._last_check_ts = 0.0
+
+        # ダウンロード進捗をワーカーから読み取るタイマー
+        self._progress_timer = QTimer(self)
+        self._progress_timer.setInterval(PROGRESS_POLL_INTERVAL_MS)
+        self._progress_timer.timeout.connect(self._poll_download_progress)
+        self._shown_progress: Optional[tuple[int, str]] = None
 
         self._setup_ui()
-        self._apply_styles()
 
     def _setup_ui(self) -> None:
         """UIをセットアップ"""
@@ -143,6 +231,7 @@ class MainWindow(QMainWindow):
         # ステータス表示
         self.status_label = QLabel("")
         self.status_label.setObjectName("statusLabel")
+        self.status_label.setProperty("state", "info")
         self.status_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.status_label.setWordWrap(True)
         layout.addWidget(self.status_label)
@@ -161,7 +250,7 @@ class MainWindow(QMainWindow):
 
         self.check_button = QPushButton("更新を確認")
         self.check_button.setObjectName("primaryButton")
-        self.check_button.clicked.connect(self._check_for_updates)
+        self.check_button.clicked.connect(lambda: self._check_for_updates(force=True))
         button_layout.addWidget(self.check_button)
 
         self.update_button = QPushButton("アップデート")
@@ -179,122 +268,78 @@ class MainWindow(QMainWindow):
         footer_label.setAlignment(Qt.AlignmentFlag.AlignRight)
         layout.addWidget(footer_label)
 
-    def _apply_styles(self) -> None:
-        """スタイルを適用"""
-        self.setStyleSheet("""
-            QMainWindow {
-                background-color: #0F172A;
-            }
-            QWidget {
-                background-color: transparent;
-                color: #E0F2FE;
-                font-family: "Segoe UI", "Yu Gothic UI", sans-serif;
-            }
-            #titleLabel {
-                font-size: 28px;
-                font-weight: bold;
-                color: #7DD3FC;
-                padding: 10px;
-            }
-            #versionWidget {
-                background-color: #1E293B;
-                border-radius: 12px;
-            }
-            #versionTitle {
-                font-size: 14px;
-                color: #94A3B8;
-            }
-            #versionValue {
-                font-size: 16px;
-                font-weight: bold;
-                color: #E0F2FE;
-            }
-            #statusLabel {
-                font-size: 14px;
-                color: #94A3B8;
-                min-height: 40px;
-            }
-            #progressBar {
-                background-color: #1E293B;
-                border: none;
-                border-radius: 8px;
-                height: 20px;
-                text-align: center;
-            }
-            #progressBar::chunk {
-                background-color: #38BDF8;
-                border-radius: 8px;
-            }
-            QPushButton {
-                font-size: 14px;
-                font-weight: bold;
-                padding: 12px 24px;
-                border-radius: 8px;
-                border: none;
-            }
-            #primaryButton {
-                background-color: #38BDF8;
-                color: #0F172A;
-            }
-            #primaryButton:hover {
-                background-color: #7DD3FC;
-            }
-            #primaryButton:disabled {
-                background-color: #475569;
-                color: #94A3B8;
-            }
-            #successButton {
-                background-color: #34D399;
-                color: #0F172A;
-            }
-            #successButton:hover {
-                background-color: #A7F3D0;
-            }
-            #successButton:disabled {
-                background-color: #475569;
-                color: #94A3B8;
-            }
-            #footerLabel {
-                font-size: 11px;
-                color: #64748B;
-            }
-            QMessageBox {
-                background-color: #1E293B;
-            }
-            QMessageBox QLabel {
-                color: #E0F2FE;
-            }
-            QMessageBox QPushButton {
-                background-color: #38BDF8;
-                color: #0F172A;
-                padding: 8px 16px;
-                border-radius: 6px;
-                min-width: 80px;
-            }
-        """)
+    def _set_status(self, text: str, state: str) -> None:
+        """
+        ステータス表示を更新
+
+        Args:
+            text: 表示するメッセージ
+            state: 表示状態（"info" / "success" / "error"、QSSで色分け）
+        """
+        self.status_label.setText(text)
+        if self.status_label.property("state") != state:
+            self.status_label.setProperty("state", state)
+            style = self.status_label.style()
+            style.unpolish(self.status_label)
+            style.polish(self.status_label)
 
     def showEvent(self, event) -> None:
         """ウィンドウ表示時に自動でバージョンチェック"""
         super().showEvent(event)
         self._check_for_updates()
 
-    def _check_for_updates(self) -> None:
-        """バージョンチェックを開始"""
+    def _check_for_updates(self, force: bool = False) -> None:
+        """
+        バージョンチェックを開始
+
+        Args:
+            force: キャッシュを無視してネットワークから取得する
+        """
+        # チェック中なら重複して開始しない
+        if self._check_task and not self._check_task.is_done:
+            return
+
+        # 有効期間内の結果があればネットワークにアクセスせず再表示
+        if (not force and self._latest_version is not None
+                and time.monotonic() - self._last_check_ts < CHECK_CACHE_TTL):
+            installed = self._installed_version
+            latest = self._latest_version
+            update_available = bool(installed) and self.checker.is_update_available(installed, latest)
+            self._on_check_finished(installed, latest, update_available)
+            return
+
         self.check_button.setEnabled(False)
         self.update_button.setEnabled(False)
         self.status_label.setText("バージョンを確認しています...")
         self.installed_label.setText("確認中...")
         self.latest_label.setText("確認中...")
 
-        self._check_thread = CheckVersionThread(self.checker)
-        self._check_thread.finished.connect(self._on_check_finished)
-        self._check_thread.error.connect(self._on_check_error)
-        self._check_thread.start()
+        if self.checker is None:
+            from ..version_checker import VersionChecker
+            self.checker = VersionChecker()
+
+        self._check_task = VersionCheckRunnable(self.checker, force)
+        self._check_task.signals.finished.connect(self._on_check_fetched)
+        self._check_task.signals.error.connect(self._on_check_error)
+        QThreadPool.globalInstance().start(self._check_task)
+
+    def _on_check_fetched(
+        self,
+        installed: Optional["PythonVersion"],
+        latest: Optional["PythonVersion"],
+        update_available: bool
+    ) -> None:
+        """ネットワークからバージョン情報を取得した時"""
+        if latest:
+            self._download_url = self.checker.get_download_url(latest)
+            self._last_check_ts = time.monotonic()
+
+        self._on_check_finished(installed, latest, update_available)
 
     def _on_check_finished(
         self,
-        installed: Optional[PythonVersion],
-        latest: Optional[PythonVersion],
+        installed: Optional["PythonVersion"],
+        latest: Optional["PythonVersion"],
         update_available: bool
     ) -> None:
         """バージョンチェック完了時"""
@@ -309,26 +354,21 @@ class MainWindow(QMainWindow):
 
         if latest:
             self.latest_label.setText(f"Python {latest.version_string}")
-            self._download_url = self.checker.get_download_url(latest)
         else:
             self.latest_label.setText("取得失敗")
 
         if update_available and self._download_url:
-            self.status_label.setText("新しいバージョンが利用可能です！")
-            self.status_label.setStyleSheet("color: #34D399;")
+            self._set_status("新しいバージョンが利用可能です！", "success")
             self.update_button.setEnabled(True)
         elif installed and latest:
-            self.status_label.setText("最新バージョンを使用しています")
-            self.status_label.setStyleSheet("color: #94A3B8;")
+            self._set_status("最新バージョンを使用しています", "info")
         else:
-            self.status_label.setText("バージョン情報を取得できませんでした")
-            self.status_label.setStyleSheet("color: #F87171;")
+            self._set_status("バージョン情報を取得できませんでした", "error")
 
     def _on_check_error(self, error: str) -> None:
         """バージョンチェックエラー時"""
         self.check_button.setEnabled(True)
-        self.status_label.setText(f"エラー: {error}")
-        self.status_label.setStyleSheet("color: #F87171;")
+        self._set_status(f"エラー: {error}", "error")
         self.installed_label.setText("不明")
         self.latest_label.setText("取得失敗")
 
@@ -352,44 +392,60 @@ class MainWindow(QMainWindow):
 
     def _start_download(self) -> None:
         """ダウンロードを開始"""
+        # ダウンロード中なら重複して開始しない
+        if self._download_task and not self._download_task.is_done:
+            return
+
         self.check_button.setEnabled(False)
         self.update_button.setEnabled(False)
         self.progress_bar.setVisible(True)
         self.progress_bar.setValue(0)
-        self.status_label.setText("ダウンロード中...")
-        self.status_label.setStyleSheet("color: #94A3B8;")
+        self._set_status("ダウンロード中...", "info")
+
+        if self.downloader is None:
+            from ..downloader import Downloader
+            self.downloader = Downloader()
 
-        self._download_thread = DownloadThread(
+        self._download_task = DownloadRunnable(
             self.downloader,
             self._download_url,
             self._latest_version
         )
-        self._download_thread.progress.connect(self._on_download_progress)
-        self._download_thread.finished.connect(self._on_download_finished)
-        self._download_thread.error.connect(self._on_download_error)
-        self._download_thread.start()
+        self._download_task.signals.finished.connect(self._on_download_finished)
+        self._download_task.signals.error.connect(self._on_download_error)
+        self._shown_progress = None
+        self._progress_timer.start()
+        QThreadPool.globalInstance().start(self._download_task)
+
+    def _poll_download_progress(self) -> None:
+        """ワーカーが記録した最新の進捗を読み取り、変わっていれば表示を更新"""
+        state = self._download_task.progress_state if self._download_task else None
+        if state is None or state == self._shown_progress:
+            return
+        self._shown_progress = state
+        self._on_download_progress(*state)
 
-    def _on_download_progress(self, downloaded: int, total: int) -> None:
+    def _on_download_progress(self, percent: int, size_text: str) -> None:
         """ダウンロード進捗更新"""
-        if total > 0:
-            percent = int((downloaded / total) * 100)
-            self.progress_bar.setValue(percent)
-            mb_downloaded = downloaded / (1024 * 1024)
-            mb_total = total / (1024 * 1024)
-            self.status_label.setText(f"ダウンロード中... {mb_downloaded:.1f} / {mb_total:.1f} MB")
+        self.progress_bar.setValue(percent)
+        self.status_label.setText(f"ダウンロード中... {size_text}")
 
     def _on_download_finished(self, filepath: str) -> None:
         """ダウンロード完了時"""
+        self._progress_timer.stop()
         self.progress_bar.setValue(100)
         self.status_label.setText("ダウンロード完了。インストーラーを起動します...")
 
         # インストーラーを起動（管理者権限で）
         installer_path = Path(filepath)
 
+        if self.installer is None:
+            from ..installer import Installer
+            self.installer = Installer()
+
         try:
             if self.installer.run_installer_elevated(installer_path):
-                self.status_label.setText("インストーラーが起動しました")
-                self.status_label.setStyleSheet("color: #34D399;")
+                self._set_status("インストーラーが起動しました", "success")
 
                 QMessageBox.information(
                     self,
@@ -398,32 +454,30 @@ class MainWindow(QMainWindow):
                     "インストール完了後、このツールを再起動して確認してください。"
                 )
             else:
-                self.status_label.setText("インストーラーの起動に失敗しました")
-                self.status_label.setStyleSheet("color: #F87171;")
+                self._set_status("インストーラーの起動に失敗しました", "error")
         except Exception as e:
-            self.status_label.setText(f"エラー: {e}")
-            self.status_label.setStyleSheet("color: #F87171;")
+            self._set_status(f"エラー: {e}", "error")
 
         self.check_button.setEnabled(True)
         self.progress_bar.setVisible(False)
 
     def _on_download_error(self, error: str) -> None:
         """ダウンロードエラー時"""
+        self._progress_timer.stop()
         self.check_button.setEnabled(True)
         self.progress_bar.setVisible(False)
-        self.status_label.setText(f"ダウンロードエラー: {error}")
-        self.status_label.setStyleSheet("color: #F87171;")
+        self._set_status(f"ダウンロードエラー: {error}", "error")
 
     def closeEvent(self, event) -> None:
         """ウィンドウを閉じる時"""
-        # スレッドを停止
-        if self._check_thread and self._check_thread.isRunning():
-            self._check_thread.quit()
-            self._check_thread.wait()
-
-        if self._download_thread and self._download_thread.isRunning():
-            self.downloader.cancel()
-            self._download_thread.quit()
-            self._download_thread.wait()
+        # 実行中のタスクを止めて完了を待つ
+        if self._check_task and not self._check_task.is_done:
+            self._check_task.cancel()
+
+        if self._download_task and not self._download_task.is_done:
+            self._download_task.cancel()
+
+        self._progress_timer.stop()
+        QThreadPool.globalInstance().waitForDone()
 
         super().closeEvent(event)
@@ -1,11 +1,13 @@
 """メインウィンドウ（スタンドアロン実行用）"""
 
 import sys
-from datetime import datetime
+import threading
+import time
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Iterator, Optional
 
-from PyQt6.QtCore import Qt, QThread, pyqtSignal
+from PyQt6.QtCore import QObject, QRunnable, Qt, pyqtSignal
 from PyQt6.QtGui import QAction, QIcon, QPixmap
 from PyQt6.QtWidgets import (
     QApplication,
@@ -22,15 +24,45 @@ from PyQt6.QtWidgets import (
 )
 
 # スタンドアロン実行用のインポート
+from http_client import create_session
 from version_checker import VersionChecker, PythonVersion
-from downloader import Downloader, DownloadError
-from installer import Installer, InstallError
 from settings_manager import SettingsManager
 from scheduler import UpdateScheduler
-from gui.options_dialog import OptionsDialog
+from utils import today_str_cached
+
+# ダウンロード・インストール・オプション画面は初回使用時に読み込む
+if TYPE_CHECKING:
+    from downloader import Downloader
+    from installer import Installer
 
 __version__ = "1.1.0"
 
+# バージョンチェック結果を再利用する期間（秒）
+CHECK_CACHE_TTL = 60 * 60
+
+# ダウンロード進捗シグナルの最小間隔（秒）
+PROGRESS_EMIT_INTERVAL = 0.1
+
+# 終了時に実行中のタスクを待つ最大時間（ミリ秒）
+# タスクはデーモンスレッドで実行するため、この時間内に終わらないものは待たずに終了する
+# （QThreadPool はアプリ終了時に無期限に完了を待ち、通信の応答待ちで終了が止まる）
+SHUTDOWN_WAIT_MS = 500
+
+
+def start_background_task(task: QRunnable) -> threading.Thread:
+    """
+    タスクをデーモンスレッドで実行
+
+    Args:
+        task: 実行するタスク（結果はタスクのシグナルでGUIスレッドへ通知される）
+
+    Returns:
+        実行中のスレッド
+    """
+    thread = threading.Thread(target=task.run, daemon=True)
+    thread.start()
+    return thread
+
 
 def get_icon_path() -> Path:
     """アイコンファイルのパスを取得"""
@@ -44,48 +76,98 @@ def get_icon_path() -> Path:
     return base_path / "icon.ico"
 
 
-class CheckVersionThread(QThread):
-    """バージョンチェック用スレッド"""
-    finished = pyqtSignal(object, object, bool)
-    error = pyqtSignal(str)
+class VersionCheckRunnable(QRunnable):
+    """バージョンチェック用タスク（バックグラウンドスレッドで実行）"""
+
+    class Signals(QObject):
+        finished = pyqtSignal(object, object, bool)
+        error = pyqtSignal(str)
 
-    def __init__(self, checker: VersionChecker) -> None:
+    def __init__(self, checker: VersionChecker, force: bool = False) -> None:
         super().__init__()
         self.checker = checker
+        self.force = force
+        self.signals = self.Signals()
+        self.is_done = False
+        self._cancelled = threading.Event()
+
+    def cancel(self) -> None:
+        """結果を通知しないようにする"""
+        self._cancelled.set()
 
     def run(self) -> None:
         try:
-            installed, latest, update_available = self.checker.check_for_updates()
-            self.finished.emit(installed, latest, update_available)
+            installed, latest, update_available = self.checker.check_for_updates(force=self.force)
+            if not self._cancelled.is_set():
+                self.signals.finished.emit(installed, latest, update_available)
         except Exception as e:
-            self.error.emit(str(e))
+            if not self._cancelled.is_set():
+                self.signals.error.emit(str(e))
+        finally:
+            self.is_done = True
 
 
-class DownloadThread(QThread):
-    """ダウンロード用スレッド"""
-    progress = pyqtSignal(int, int)
-    finished = pyqtSignal(str)
-    error = pyqtSignal(str)
+class DownloadRunnable(QRunnable):
+    """ダウンロード用タスク（バックグラウンドスレッドで実行）"""
 
-    def __init__(self, downloader: Downloader, url: str, version: PythonVersion) -> None:
+    class Signals(QObject):
+        progress = pyqtSignal(int, int)
+        finished = pyqtSignal(str)
+        error = pyqtSignal(str)
+
+    def __init__(self, downloader: "Downloader", url: str, version: PythonVersion) -> None:
         super().__init__()
         self.downloader = downloader
         self.url = url
         self.version = version
+        self.signals = self.Signals()
+        self.is_done = False
+        self._cancelled = threading.Event()
+
+        # 進捗シグナルの間引き用
+        self._last_percent = -1
+        self._last_emit_ts = 0.0
+
+    def cancel(self) -> None:
+        """ダウンロードを中断し、結果を通知しないようにする"""
+        self._cancelled.set()
+        self.downloader.cancel()
 
     def run(self) -> None:
+        from downloader import DownloadError
+
         try:
             filepath = self.downloader.download(
                 self.url,
                 self.version,
                 progress_callback=self._on_progress
             )
-            self.finished.emit(str(filepath))
+            if not self._cancelled.is_set():
+                self.signals.finished.emit(str(filepath))
         except DownloadError as e:
-            self.error.emit(str(e))
+            if not self._cancelled.is_set():
+                self.signals.error.emit(str(e))
+        except Exception as e:
+            # 例外を run() の外へ出すとアプリが異常終了するため、想定外のものもエラーとして通知
+            if not self._cancelled.is_set():
+                self.signals.error.emit(f"ダウンロードに失敗しました: {e}")
+        finally:
+            self.is_done = True
 
     def _on_progress(self, downloaded: int, total: int) -> None:
-        self.progress.emit(downloaded, total)
+        if self._cancelled.is_set():
+            return
+
+        # パーセントが変わらず前回から100ms未満なら通知しない（完了時は必ず通知）
+        now = time.monotonic()
+        percent = downloaded * 100 // total if total > 0 else 0
+        if (percent == self._last_percent and now - self._last_emit_ts < PROGRESS_EMIT_INTERVAL
+                and downloaded != total):
+            return
+
+        self._last_percent = percent
+        self._last_emit_ts = now
+        self.signals.progress.emit(downloaded, total)
 
 
 class MainWindow(QMainWindow):
@@ -93,26 +175,47 @@ class MainWindow(QMainWindow):
 
     def __init__(self) -> None:
         super().__init__()
-        self.checker = VersionChecker()
-        self.downloader = Downloader()
-        self.installer = Installer()
+        # バージョンチェックとダウンロードで接続を共有（再試行回数はバージョンチェックに合わせる）
+        self._http = create_session(
+            user_agent=f"PyAutoUpdate/{__version__}",
+            retries=VersionChecker.MAX_RETRIES
+        )
+        self.checker = VersionChecker(session=self._http)
+        self.downloader: Optional["Downloader"] = None
+        self.installer: Optional["Installer"] = None
         self.settings_manager = SettingsManager()
         self.scheduler = UpdateScheduler(self)
 
         self._installed_version: Optional[PythonVersion] = None
         self._latest_version: Optional[PythonVersion] = None
         self._download_url: Optional[str] = None
-        self._check_thread: Optional[CheckVersionThread] = None
-        self._download_thread: Optional[DownloadThread] = None
+        self._check_task: Optional[VersionCheckRunnable] = None
+        self._download_task: Optional[DownloadRunnable] = None
+        self._task_threads: list[threading.Thread] = []
         self._is_auto_update = False  # 自動アップデートかどうか
 
+        # バージョンチェック結果のキャッシュ（time.monotonic()基準）
+        self._cached_latest: Optional[PythonVersion] = None
+        self._last_check_ts = 0.0
+
+        # 最後に表示したダウンロード進捗（%）と合計サイズ（MB、未取得は0）
+        self._download_percent = -1
+        self._download_mb_total = 0.0
+
+        # 最後に表示したトレイ通知の種別（同じ通知の連続表示を防ぐ）
+        self._last_toast: Optional[tuple[str, str]] = None
+
+        # アップデート確認ダイアログ（初回表示時に作成）
+        self._confirm_box: Optional[QMessageBox] = None
+
+        self._restore_check_cache()
+
         # アイコンを設定
         self._app_icon = self._load_icon()
 
         self._setup_ui()
         self._setup_tray()
         self._setup_scheduler()
-        self._apply_styles()
 
     def _load_icon(self) -> QIcon:
         """アプリアイコンを読み込み"""
@@ -187,6 +290,7 @@ class MainWindow(QMainWindow):
         # ステータス表示
         self.status_label = QLabel("")
         self.status_label.setObjectName("statusLabel")
+        self.status_label.setProperty("state", "info")
         self.status_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.status_label.setWordWrap(True)
         layout.addWidget(self.status_label)
@@ -205,7 +309,7 @@ class MainWindow(QMainWindow):
 
         self.check_button = QPushButton("更新を確認")
         self.check_button.setObjectName("primaryButton")
-        self.check_button.clicked.connect(self._check_for_updates)
+        self.check_button.clicked.connect(lambda: self._check_for_updates(force=True))
         button_layout.addWidget(self.check_button)
 
         self.update_button = QPushButton("アップデート")
@@ -241,25 +345,23 @@ class MainWindow(QMainWindow):
         # トレイメニュー
         tray_menu = QMenu()
 
-        show_action = QAction("表示", self)
-        show_action.triggered.connect(self._show_window)
-        tray_menu.addAction(show_action)
-
-        check_action = QAction("今すぐチェック", self)
-        check_action.triggered.connect(self._check_for_updates)
-        tray_menu.addAction(check_action)
-
-        tray_menu.addSeparator()
-
-        options_action = QAction("オプション設定", self)
-        options_action.triggered.connect(self._show_options)
-        tray_menu.addAction(options_action)
-
-        tray_menu.addSeparator()
-
-        quit_action = QAction("終了", self)
-        quit_action.triggered.connect(self._quit_app)
-        tray_menu.addAction(quit_action)
+        # (表示名, スロット)、None は区切り線
+        menu_items = (
+            ("表示", self._show_window),
+            ("今すぐチェック", lambda: self._check_for_updates(force=True)),
+            None,
+            ("オプション設定", self._show_options),
+            None,
+            ("終了", self._quit_app),
+        )
+        for item in menu_items:
+            if item is None:
+                tray_menu.addSeparator()
+                continue
+            label, slot = item
+            action = QAction(label, self)
+            action.triggered.connect(slot)
+            tray_menu.addAction(action)
 
         self.tray_icon.setContextMenu(tray_menu)
         self.tray_icon.activated.connect(self._on_tray_activated)
@@ -279,122 +381,11 @@ class MainWindow(QMainWindow):
 
         if settings.auto_update_enabled:
             self.scheduler.start()
-            self._update_next_check_label(self.scheduler.next_check_datetime.strftime("%Y-%m-%d %H:%M") if self.scheduler.next_check_datetime else "")
-
-    def _apply_styles(self) -> None:
-        """スタイルを適用"""
-        self.setStyleSheet("""
-            QMainWindow {
-                background-color: #0F172A;
-            }
-            QWidget {
-                background-color: transparent;
-                color: #E0F2FE;
-                font-family: "Segoe UI", "Yu Gothic UI", sans-serif;
-            }
-            #titleLabel {
-                font-size: 28px;
-                font-weight: bold;
-                color: #7DD3FC;
-                padding: 10px;
-            }
-            #versionWidget {
-                background-color: #1E293B;
-                border-radius: 12px;
-            }
-            #versionTitle {
-                font-size: 14px;
-                color: #94A3B8;
-            }
-            #versionValue {
-                font-size: 16px;
-                font-weight: bold;
-                color: #E0F2FE;
-            }
-            #nextCheckLabel {
-                font-size: 12px;
-                color: #64748B;
-            }
-            #statusLabel {
-                font-size: 14px;
-                color: #94A3B8;
-                min-height: 40px;
-            }
-            #progressBar {
-                background-color: #1E293B;
-                border: none;
-                border-radius: 8px;
-                height: 20px;
-                text-align: center;
-            }
-            #progressBar::chunk {
-                background-color: #38BDF8;
-                border-radius: 8px;
-            }
-            QPushButton {
-                font-size: 14px;
-                font-weight: bold;
-                padding: 12px 24px;
-                border-radius: 8px;
-                border: none;
-            }
-            #primaryButton {
-                background-color: #38BDF8;
-                color: #0F172A;
-            }
-            #primaryButton:hover {
-                background-color: #7DD3FC;
-            }
-            #primaryButton:disabled {
-                background-color: #475569;
-                color: #94A3B8;
-            }
-            #successButton {
-                background-color: #34D399;
-                color: #0F172A;
-            }
-            #successButton:hover {
-                background-color: #A7F3D0;
-            }
-            #successButton:disabled {
-                background-color: #475569;
-                color: #94A3B8;
-            }
-            #optionsButton {
-                background-color: transparent;
-                color: #64748B;
-                font-size: 12px;
-                padding: 8px 16px;
-                border: 1px solid #475569;
-            }
-            #optionsButton:hover {
-                color: #94A3B8;
-                border-color: #64748B;
-            }
-            #footerLabel {
-                font-size: 11px;
-                color: #64748B;
-            }
-            QMessageBox {
-                background-color: #1E293B;
-            }
-            QMessageBox QLabel {
-                color: #E0F2FE;
-            }
-            QMessageBox QPushButton {
-                background-color: #38BDF8;
-                color: #0F172A;
-                padding: 8px 16px;
-                border-radius: 6px;
-                min-width: 80px;
-            }
-        """)
 
     def showEvent(self, event) -> None:
         """ウィンドウ表示時に自動でバージョンチェック"""
         super().showEvent(event)
-        if not self._check_thread or not self._check_thread.isRunning():
-            self._check_for_updates()
+        self._check_for_updates()
 
     def _show_window(self) -> None:
         """ウィンドウを表示"""
@@ -404,6 +395,8 @@ class MainWindow(QMainWindow):
 
     def _show_options(self) -> None:
         """オプション設定を表示"""
+        from gui.options_dialog import OptionsDialog
+
         dialog = OptionsDialog(self.settings_manager, self)
         dialog.settings_changed.connect(self._on_settings_changed)
         dialog.exec()
@@ -420,11 +413,6 @@ class MainWindow(QMainWindow):
             self.scheduler.stop()
             self.next_check_label.setText("")
 
-        self._update_next_check_label(
-            self.scheduler.next_check_datetime.strftime("%Y-%m-%d %H:%M")
-            if self.scheduler.next_check_datetime else ""
-        )
-
     def _update_next_check_label(self, next_check: str) -> None:
         """次回チェック予定を更新"""
         if next_check:
@@ -434,87 +422,184 @@ class MainWindow(QMainWindow):
 
     def _on_scheduled_check(self) -> None:
         """定時チェックがトリガーされた時"""
+        # ダウンロード中はチェックしない
+        if self._download_task and not self._download_task.is_done:
+            return
+
         self._is_auto_update = True
 
-        # 最終チェック日を保存
-        today = datetime.now().strftime("%Y-%m-%d")
-        self.settings_manager.set_last_check_date(today)
+        # 最終チェック日を保存（同じ日なら書き込まない）
+        self.settings_manager.set_last_check_date(today_str_cached())
 
         # バージョンチェック開始
         self._check_for_updates()
 
+    def _set_status(self, text: str, state: str) -> None:
+        """
+        ステータス表示を更新
+
+        Args:
+            text: 表示するメッセージ
+            state: 表示状態（"info" / "success" / "error"、QSSで色分け）
+        """
+        self.status_label.setText(text)
+        if self.status_label.property("state") != state:
+            self.status_label.setProperty("state", state)
+            style = self.status_label.style()
+            style.unpolish(self.status_label)
+            style.polish(self.status_label)
+
+    @contextmanager
+    def _batched_updates(self) -> Iterator[None]:
+        """ブロック内のウィジェット更新をまとめて1回で再描画する"""
+        widget = self.centralWidget()
+        widget.setUpdatesEnabled(False)
+        try:
+            yield
+        finally:
+            widget.setUpdatesEnabled(True)
+
+    def _toast(self, message: str, key: tuple[str, str], msecs: int) -> None:
+        """
+        トレイ通知を表示
+
+        Args:
+            message: 通知メッセージ
+            key: 通知の種別（直前と同じ場合は表示しない）
+            msecs: 表示時間（ミリ秒）
+        """
+        if not QSystemTrayIcon.supportsMessages() or key == self._last_toast:
+            return
+        self._last_toast = key
+        self.tray_icon.showMessage(
+            "Python AutoUpdate",
+            message,
+            QSystemTrayIcon.MessageIcon.Information,
+            msecs
+        )
+
     def _on_tray_activated(self, reason: QSystemTrayIcon.ActivationReason) -> None:
         """トレイアイコンがアクティブになった時"""
         if reason == QSystemTrayIcon.ActivationReason.DoubleClick:
             self._show_window()
 
-    def _check_for_updates(self) -> None:
-        """バージョンチェックを開始"""
-        self.check_button.setEnabled(False)
-        self.update_button.setEnabled(False)
-        self.status_label.setText("バージョンを確認しています...")
-        self.status_label.setStyleSheet("color: #94A3B8;")
-        self.installed_label.setText("確認中...")
-        self.latest_label.setText("確認中...")
+    def _restore_check_cache(self) -> None:
+        """前回起動時のバージョンチェック結果を設定から復元"""
+        settings = self.settings_manager.settings
+        age = time.time() - settings.cached_checked_at
+        if not 0 <= age < CHECK_CACHE_TTL or not settings.cached_download_url:
+            return
+
+        latest = PythonVersion.from_string(settings.cached_latest_version)
+        if latest:
+            self._cached_latest = latest
+            self._download_url = settings.cached_download_url
+            self._last_check_ts = time.monotonic() - age
+
+    def _store_check_cache(self, latest: PythonVersion, download_url: str) -> None:
+        """バージョンチェック結果をキャッシュ（設定にも保存）"""
+        self._cached_latest = latest
+        self._last_check_ts = time.monotonic()
+        self.settings_manager.set_check_cache(latest.version_string, download_url, time.time())
+
+    def _check_for_updates(self, force: bool = False) -> None:
+        """
+        バージョンチェックを開始
+
+        Args:
+            force: キャッシュを無視してネットワークから取得する
+        """
+        # チェック中なら重複して開始しない
+        if self._check_task and not self._check_task.is_done:
+            return
 
-        self._check_thread = CheckVersionThread(self.checker)
-        self._check_thread.finished.connect(self._on_check_finished)
-        self._check_thread.error.connect(self._on_check_error)
-        self._check_thread.start()
+        # ダウンロード中はボタンや状態表示を上書きしない
+        if self._download_task and not self._download_task.is_done:
+            return
 
-    def _on_check_finished(
+        # 有効期間内のキャッシュがあればネットワークにアクセスしない
+        if (not force and self._cached_latest
+                and time.monotonic() - self._last_check_ts < CHECK_CACHE_TTL):
+            installed = self.checker.get_installed_version()
+            latest = self._cached_latest
+            update_available = bool(installed) and self.checker.is_update_available(installed, latest)
+            self._on_check_finished(installed, latest, update_available)
+            return
+
+        with self._batched_updates():
+            self.check_button.setEnabled(False)
+            self.update_button.setEnabled(False)
+            self._set_status("バージョンを確認しています...", "info")
+            self.installed_label.setText("確認中...")
+            self.latest_label.setText("確認中...")
+
+        self._check_task = VersionCheckRunnable(self.checker, force)
+        self._check_task.signals.finished.connect(self._on_check_fetched)
+        self._check_task.signals.error.connect(self._on_check_error)
+        self._start_task(self._check_task)
+
+    def _on_check_fetched(
         self,
         installed: Optional[PythonVersion],
         latest: Optional[PythonVersion],
         update_available: bool
     ) -> None:
-        """バージョンチェック完了時"""
-        self.check_button.setEnabled(True)
-        self._installed_version = installed
-        self._latest_version = latest
-
-        if installed:
-            self.installed_label.setText(f"Python {installed.version_string}")
-        else:
-            self.installed_label.setText("インストールされていません")
-
+        """ネットワークからバージョン情報を取得した時"""
         if latest:
-            self.latest_label.setText(f"Python {latest.version_string}")
             self._download_url = self.checker.get_download_url(latest)
-        else:
-            self.latest_label.setText("取得失敗")
+            if self._download_url:
+                self._store_check_cache(latest, self._download_url)
+
+        self._on_check_finished(installed, latest, update_available)
 
-        if update_available and self._download_url:
-            self.status_label.setText("新しいバージョンが利用可能です！")
-            self.status_label.setStyleSheet("color: #34D399;")
-            self.update_button.setEnabled(True)
+    def _on_check_finished(
+        self,
+        installed: Optional[PythonVersion],
+        latest: Optional[PythonVersion],
+        update_available: bool
+    ) -> None:
+        """バージョンチェック完了時"""
+        with self._batched_updates():
+            self.check_button.setEnabled(True)
+            self._installed_version = installed
+            self._latest_version = latest
 
-            # 自動インストールが有効で、自動チェックの場合
-            if self._is_auto_update and self.settings_manager.settings.auto_install_enabled:
-                self._is_auto_update = False
-                self._start_auto_update()
+            if installed:
+                self.installed_label.setText(f"Python {installed.version_string}")
             else:
-                # トレイ通知
-                self.tray_icon.showMessage(
-                    "Python AutoUpdate",
-                    f"新しいバージョン Python {latest.version_string} が利用可能です",
-                    QSystemTrayIcon.MessageIcon.Information,
-                    5000
-                )
-        elif installed and latest:
-            self.status_label.setText("最新バージョンを使用しています")
-            self.status_label.setStyleSheet("color: #94A3B8;")
-        else:
-            self.status_label.setText("バージョン情報を取得できませんでした")
-            self.status_label.setStyleSheet("color: #F87171;")
+                self.installed_label.setText("インストールされていません")
 
-        self._is_auto_update = False
+            if latest:
+                self.latest_label.setText(f"Python {latest.version_string}")
+            else:
+                self.latest_label.setText("取得失敗")
+
+            if update_available and self._download_url:
+                self._set_status("新しいバージョンが利用可能です！", "success")
+                self.update_button.setEnabled(True)
+
+                # 自動インストールが有効で、自動チェックの場合
+                if self._is_auto_update and self.settings_manager.settings.auto_install_enabled:
+                    self._is_auto_update = False
+                    self._start_auto_update()
+                else:
+                    # トレイ通知
+                    self._toast(
+                        f"新しいバージョン Python {latest.version_string} が利用可能です",
+                        ("available", latest.version_string),
+                        5000
+                    )
+            elif installed and latest:
+                self._set_status("最新バージョンを使用しています", "info")
+            else:
+                self._set_status("バージョン情報を取得できませんでした", "error")
+
+            self._is_auto_update = False
 
     def _on_check_error(self, error: str) -> None:
         """バージョンチェックエラー時"""
         self.check_button.setEnabled(True)
-        self.status_label.setText(f"エラー: {error}")
-        self.status_label.setStyleSheet("color: #F87171;")
+        self._set_status(f"エラー: {error}", "error")
         self.installed_label.setText("不明")
         self.latest_label.setText("取得失敗")
         self._is_auto_update = False
@@ -524,16 +609,22 @@ class MainWindow(QMainWindow):
         if not self._latest_version or not self._download_url:
             return
 
-        reply = QMessageBox.question(
-            self,
-            "確認",
+        # 確認ダイアログは初回に作成して使い回す
+        if self._confirm_box is None:
+            self._confirm_box = QMessageBox(self)
+            self._confirm_box.setIcon(QMessageBox.Icon.Question)
+            self._confirm_box.setWindowTitle("確認")
+            self._confirm_box.setStandardButtons(
+                QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
+            )
+            self._confirm_box.setDefaultButton(QMessageBox.StandardButton.Yes)
+
+        self._confirm_box.setText(
             f"Python {self._latest_version.version_string} をダウンロードしてインストールしますか？\n\n"
-            "※ インストール時は「Add Python to PATH」にチェックを入れてください",
-            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
-            QMessageBox.StandardButton.Yes
+            "※ インストール時は「Add Python to PATH」にチェックを入れてください"
         )
 
-        if reply != QMessageBox.StandardButton.Yes:
+        if self._confirm_box.exec() != QMessageBox.StandardButton.Yes:
             return
 
         self._start_download()
@@ -544,10 +635,9 @@ class MainWindow(QMainWindow):
             return
 
         # トレイ通知
-        self.tray_icon.showMessage(
-            "Python AutoUpdate",
+        self._toast(
             f"Python {self._latest_version.version_string} の自動インストールを開始します",
-            QSystemTrayIcon.MessageIcon.Information,
+            ("auto_update", self._latest_version.version_string),
             3000
         )
 
@@ -555,66 +645,89 @@ class MainWindow(QMainWindow):
 
     def _start_download(self) -> None:
         """ダウンロードを開始"""
+        # ダウンロード中なら重複して開始しない
+        if self._download_task and not self._download_task.is_done:
+            return
+
         self.check_button.setEnabled(False)
         self.update_button.setEnabled(False)
         self.progress_bar.setVisible(True)
         self.progress_bar.setValue(0)
-        self.status_label.setText("ダウンロード中...")
-        self.status_label.setStyleSheet("color: #94A3B8;")
+        self._set_status("ダウンロード中...", "info")
+        self._download_percent = -1
+        self._download_mb_total = 0.0
 
-        self._download_thread = DownloadThread(
+        if self.downloader is None:
+            from downloader import Downloader
+            self.downloader = Downloader(session=self._http)
+
+        self._download_task = DownloadRunnable(
             self.downloader,
             self._download_url,
             self._latest_version
         )
-        self._download_thread.progress.connect(self._on_download_progress)
-        self._download_thread.finished.connect(self._on_download_finished)
-        self._download_thread.error.connect(self._on_download_error)
-        self._download_thread.start()
+        self._download_task.signals.progress.connect(self._on_download_progress)
+        self._download_task.signals.finished.connect(self._on_download_finished)
+        self._download_task.signals.error.connect(self._on_download_error)
+        self._start_task(self._download_task)
+
+    def _start_task(self, task: QRunnable) -> None:
+        """タスクをバックグラウンドで開始し、終了時に待てるようスレッドを記録"""
+        self._task_threads = [t for t in self._task_threads if t.is_alive()]
+        self._task_threads.append(start_background_task(task))
 
     def _on_download_progress(self, downloaded: int, total: int) -> None:
         """ダウンロード進捗更新"""
         if total > 0:
-            percent = int((downloaded / total) * 100)
+            # パーセントが変わった時だけ表示を更新
+            percent = downloaded * 100 // total
+            if percent == self._download_percent:
+                return
+            self._download_percent = percent
+
+            if not self._download_mb_total:
+                self._download_mb_total = total / (1024 * 1024)
+
             self.progress_bar.setValue(percent)
             mb_downloaded = downloaded / (1024 * 1024)
-            mb_total = total / (1024 * 1024)
-            self.status_label.setText(f"ダウンロード中... {mb_downloaded:.1f} / {mb_total:.1f} MB")
+            self.status_label.setText(
+                f"ダウンロード中... {mb_downloaded:.1f} / {self._download_mb_total:.1f} MB"
+            )
 
     def _on_download_finished(self, filepath: str) -> None:
         """ダウンロード完了時"""
-        self.progress_bar.setValue(100)
-        self.status_label.setText("ダウンロード完了。インストーラーを起動します...")
+        with self._batched_updates():
+            self.progress_bar.setValue(100)
+            self.status_label.setText("ダウンロード完了。インストーラーを起動します...")
 
-        installer_path = Path(filepath)
+            installer_path = Path(filepath)
 
-        try:
-            if self.installer.run_installer_elevated(installer_path):
-                self.status_label.setText("インストーラーが起動しました")
-                self.status_label.setStyleSheet("color: #34D399;")
-
-                self.tray_icon.showMessage(
-                    "Python AutoUpdate",
-                    "Pythonインストーラーが起動しました",
-                    QSystemTrayIcon.MessageIcon.Information,
-                    3000
-                )
-            else:
-                self.status_label.setText("インストーラーの起動に失敗しました")
-                self.status_label.setStyleSheet("color: #F87171;")
-        except Exception as e:
-            self.status_label.setText(f"エラー: {e}")
-            self.status_label.setStyleSheet("color: #F87171;")
+            if self.installer is None:
+                from installer import Installer
+                self.installer = Installer()
 
-        self.check_button.setEnabled(True)
-        self.progress_bar.setVisible(False)
+            try:
+                if self.installer.run_installer_elevated(installer_path):
+                    self._set_status("インストーラーが起動しました", "success")
+
+                    self._toast(
+                        "Pythonインストーラーが起動しました",
+                        ("installer_started", installer_path.name),
+                        3000
+                    )
+                else:
+                    self._set_status("インストーラーの起動に失敗しました", "error")
+            except Exception as e:
+                self._set_status(f"エラー: {e}", "error")
+
+            self.check_button.setEnabled(True)
+            self.progress_bar.setVisible(False)
 
     def _on_download_error(self, error: str) -> None:
         """ダウンロードエラー時"""
         self.check_button.setEnabled(True)
         self.progress_bar.setVisible(False)
-        self.status_label.setText(f"ダウンロードエラー: {error}")
-        self.status_label.setStyleSheet("color: #F87171;")
+        self._set_status(f"ダウンロードエラー: {error}", "error")
 
     def closeEvent(self, event) -> None:
         """ウィンドウを閉じる時"""
@@ -622,12 +735,7 @@ class MainWindow(QMainWindow):
         if self.settings_manager.settings.minimize_to_tray:
             event.ignore()
             self.hide()
-            self.tray_icon.showMessage(
-                "Python AutoUpdate",
-                "トレイに最小化しました",
-                QSystemTrayIcon.MessageIcon.Information,
-                2000
-            )
+            self._toast("トレイに最小化しました", ("minimized", ""), 2000)
             return
 
         self._cleanup_and_quit()
@@ -643,15 +751,21 @@ class MainWindow(QMainWindow):
         # スケジューラーを停止
         self.scheduler.stop()
 
-        # スレッドを停止
-        if self._check_thread and self._check_thread.isRunning():
-            self._check_thread.quit()
-            self._check_thread.wait()
+        # 実行中のタスクにキャンセルを通知し、短時間だけ完了を待つ
+        # （通信の応答待ちで終了が止まらないよう無期限には待たない）
+        if self._check_task and not self._check_task.is_done:
+            self._check_task.cancel()
+
+        if self._download_task and not self._download_task.is_done:
+            self._download_task.cancel()
+
+        deadline = time.monotonic() + SHUTDOWN_WAIT_MS / 1000
+        for thread in self._task_threads:
+            thread.join(max(deadline - time.monotonic(), 0))
+        self._http.close()
 
-        if self._download_thread and self._download_thread.isRunning():
-            self.downloader.cancel()
-            self._download_thread.quit()
-            self._download_thread.wait()
+        # 保存待ちの設定を書き込む
+        self.settings_manager.flush()
 
         # トレイアイコンを非表示
         self.tray_icon.hide()
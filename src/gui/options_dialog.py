@@ -10,7 +10,6 @@ from PyQt6.QtWidgets import (
     QPushButton,
     QTimeEdit,
     QVBoxLayout,
-    QWidget,
 )
 from PyQt6.QtCore import QTime
 
@@ -29,7 +28,6 @@ class OptionsDialog(QDialog):
         super().__init__(parent)
         self.settings_manager = settings_manager
         self._setup_ui()
-        self._apply_styles()
         self._load_current_settings()
 
     def _setup_ui(self) -> None:
@@ -124,111 +122,20 @@ class OptionsDialog(QDialog):
 
         layout.addLayout(button_layout)
 
-    def _apply_styles(self) -> None:
-        """スタイルを適用"""
-        self.setStyleSheet("""
-            QDialog {
-                background-color: #0F172A;
-            }
-            QWidget {
-                color: #E0F2FE;
-                font-family: "Segoe UI", "Yu Gothic UI", sans-serif;
-            }
-            #settingsGroup {
-                background-color: #1E293B;
-                border: 1px solid #334155;
-                border-radius: 8px;
-                padding: 15px;
-                margin-top: 10px;
-            }
-            #settingsGroup::title {
-                color: #7DD3FC;
-                font-weight: bold;
-                padding: 0 8px;
-            }
-            #settingsCheckbox {
-                font-size: 13px;
-                spacing: 8px;
-                min-height: 28px;
-                padding: 4px 0px;
-            }
-            #settingsCheckbox::indicator {
-                width: 18px;
-                height: 18px;
-                border-radius: 4px;
-                border: 2px solid #475569;
-                background-color: #1E293B;
-            }
-            #settingsCheckbox::indicator:checked {
-                background-color: #38BDF8;
-                border-color: #38BDF8;
-            }
-            #settingsCheckbox::indicator:hover {
-                border-color: #7DD3FC;
-            }
-            #settingsLabel {
-                font-size: 13px;
-                color: #94A3B8;
-                min-height: 24px;
-            }
-            #warningLabel {
-                font-size: 11px;
-                color: #FBBF24;
-                margin-top: 5px;
-                min-height: 20px;
-            }
-            #timeEdit {
-                background-color: #1E293B;
-                border: 1px solid #475569;
-                border-radius: 6px;
-                padding: 6px 12px;
-                font-size: 14px;
-                color: #E0F2FE;
-                min-width: 100px;
-                min-height: 28px;
-            }
-            #timeEdit:disabled {
-                color: #64748B;
-                background-color: #0F172A;
-            }
-            QPushButton {
-                font-size: 13px;
-                font-weight: bold;
-                padding: 10px 20px;
-                border-radius: 6px;
-                border: none;
-                min-width: 100px;
-            }
-            #primaryButton {
-                background-color: #38BDF8;
-                color: #0F172A;
-            }
-            #primaryButton:hover {
-                background-color: #7DD3FC;
-            }
-            #secondaryButton {
-                background-color: #475569;
-                color: #E0F2FE;
-            }
-            #secondaryButton:hover {
-                background-color: #64748B;
-            }
-        """)
-
     def _load_current_settings(self) -> None:
         """現在の設定を読み込んでUIに反映"""
         settings = self.settings_manager.settings
 
+        # 依存する項目はここで直接設定するため、読み込み中は stateChanged を発行しない
+        self.auto_check_checkbox.blockSignals(True)
         self.auto_check_checkbox.setChecked(settings.auto_update_enabled)
+        self.auto_check_checkbox.blockSignals(False)
         self.time_edit.setEnabled(settings.auto_update_enabled)
         self.auto_install_checkbox.setEnabled(settings.auto_update_enabled)
 
-        # 時刻を設定
-        try:
-            hour, minute = map(int, settings.scheduled_time.split(":"))
-            self.time_edit.setTime(QTime(hour, minute))
-        except (ValueError, AttributeError):
-            self.time_edit.setTime(QTime(9, 0))
+        # 時刻を設定（不正な形式なら9:00）
+        scheduled = QTime.fromString(settings.scheduled_time, "H:mm")
+        self.time_edit.setTime(scheduled if scheduled.isValid() else QTime(9, 0))
 
         self.auto_install_checkbox.setChecked(settings.auto_install_enabled)
         self.minimize_to_tray_checkbox.setChecked(settings.minimize_to_tray)
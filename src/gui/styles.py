@@ -0,0 +1,204 @@
+"""アプリケーション共通のスタイルシート"""
+
+# QApplication に一度だけ設定する。トレイメニュー等に影響しないよう、
+# メインウィンドウ・オプション設定ダイアログ・メッセージボックス配下に限定して記述する。
+# ダイアログ類はメインウィンドウの子になるため、"QMainWindow QWidget" より詳細度の高い
+# セレクタを併記するか、同じ詳細度の規則を後に置いて上書きする。
+APP_QSS = """
+    /* メインウィンドウ */
+    QMainWindow {
+        background-color: #0F172A;
+    }
+    QMainWindow QWidget {
+        background-color: transparent;
+        color: #E0F2FE;
+        font-family: "Segoe UI", "Yu Gothic UI", sans-serif;
+    }
+    #titleLabel {
+        font-size: 28px;
+        font-weight: bold;
+        color: #7DD3FC;
+        padding: 10px;
+    }
+    #versionWidget {
+        background-color: #1E293B;
+        border-radius: 12px;
+    }
+    #versionTitle {
+        font-size: 14px;
+        color: #94A3B8;
+    }
+    #versionValue {
+        font-size: 16px;
+        font-weight: bold;
+        color: #E0F2FE;
+    }
+    #nextCheckLabel {
+        font-size: 12px;
+        color: #64748B;
+    }
+    #statusLabel {
+        font-size: 14px;
+        color: #94A3B8;
+        min-height: 40px;
+    }
+    #statusLabel[state="success"] {
+        color: #34D399;
+    }
+    #statusLabel[state="error"] {
+        color: #F87171;
+    }
+    #progressBar {
+        background-color: #1E293B;
+        border: none;
+        border-radius: 8px;
+        height: 20px;
+        text-align: center;
+    }
+    #progressBar::chunk {
+        background-color: #38BDF8;
+        border-radius: 8px;
+    }
+    QMainWindow QPushButton {
+        font-size: 14px;
+        font-weight: bold;
+        padding: 12px 24px;
+        border-radius: 8px;
+        border: none;
+    }
+    #primaryButton {
+        background-color: #38BDF8;
+        color: #0F172A;
+    }
+    #primaryButton:hover {
+        background-color: #7DD3FC;
+    }
+    #primaryButton:disabled {
+        background-color: #475569;
+        color: #94A3B8;
+    }
+    #successButton {
+        background-color: #34D399;
+        color: #0F172A;
+    }
+    #successButton:hover {
+        background-color: #A7F3D0;
+    }
+    #successButton:disabled {
+        background-color: #475569;
+        color: #94A3B8;
+    }
+    #optionsButton {
+        background-color: transparent;
+        color: #64748B;
+        font-size: 12px;
+        padding: 8px 16px;
+        border: 1px solid #475569;
+    }
+    #optionsButton:hover {
+        color: #94A3B8;
+        border-color: #64748B;
+    }
+    #footerLabel {
+        font-size: 11px;
+        color: #64748B;
+    }
+
+    /* メッセージボックス */
+    QMessageBox,
+    QMainWindow QMessageBox {
+        background-color: #1E293B;
+    }
+    QMessageBox QLabel {
+        color: #E0F2FE;
+    }
+    QMessageBox QPushButton {
+        background-color: #38BDF8;
+        color: #0F172A;
+        padding: 8px 16px;
+        border-radius: 6px;
+        min-width: 80px;
+    }
+
+    /* オプション設定ダイアログ */
+    OptionsDialog,
+    QMainWindow OptionsDialog {
+        background-color: #0F172A;
+    }
+    OptionsDialog QWidget {
+        color: #E0F2FE;
+        font-family: "Segoe UI", "Yu Gothic UI", sans-serif;
+    }
+    #settingsGroup {
+        background-color: #1E293B;
+        border: 1px solid #334155;
+        border-radius: 8px;
+        padding: 15px;
+        margin-top: 10px;
+    }
+    #settingsGroup::title {
+        color: #7DD3FC;
+        font-weight: bold;
+        padding: 0 8px;
+    }
+    #settingsCheckbox {
+        font-size: 13px;
+        spacing: 8px;
+        min-height: 28px;
+        padding: 4px 0px;
+    }
+    #settingsCheckbox::indicator {
+        width: 18px;
+        height: 18px;
+        border-radius: 4px;
+        border: 2px solid #475569;
+        background-color: #1E293B;
+    }
+    #settingsCheckbox::indicator:checked {
+        background-color: #38BDF8;
+        border-color: #38BDF8;
+    }
+    #settingsCheckbox::indicator:hover {
+        border-color: #7DD3FC;
+    }
+    #settingsLabel {
+        font-size: 13px;
+        color: #94A3B8;
+        min-height: 24px;
+    }
+    #warningLabel {
+        font-size: 11px;
+        color: #FBBF24;
+        margin-top: 5px;
+        min-height: 20px;
+    }
+    #timeEdit {
+        background-color: #1E293B;
+        border: 1px solid #475569;
+        border-radius: 6px;
+        padding: 6px 12px;
+        font-size: 14px;
+        color: #E0F2FE;
+        min-width: 100px;
+        min-height: 28px;
+    }
+    #timeEdit:disabled {
+        color: #64748B;
+        background-color: #0F172A;
+    }
+    OptionsDialog QPushButton {
+        font-size: 13px;
+        font-weight: bold;
+        padding: 10px 20px;
+        border-radius: 6px;
+        border: none;
+        min-width: 100px;
+    }
+    #secondaryButton {
+        background-color: #475569;
+        color: #E0F2FE;
+    }
+    #secondaryButton:hover {
+        background-color: #64748B;
+    }
+"""
@@ -0,0 +1,34 @@
+"""HTTP通信の共通設定"""
+
+from typing import Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+def create_session(user_agent: Optional[str] = None, retries: int = 3) -> requests.Session:
+    """
+    接続を使い回すためのセッションを作成
+
+    バージョンチェックとダウンロードで共有し、TCP/TLS接続をキープアライブで再利用する。
+
+    Args:
+        user_agent: User-Agentヘッダー（Noneの場合はrequestsの既定値）
+        retries: 接続エラー等で再試行する最大回数
+
+    Returns:
+        設定済みのセッション
+    """
+    session = requests.Session()
+    # 並列ダウンロード（4セグメント）が同一ホストへ同時接続できるだけのプールを確保
+    adapter = HTTPAdapter(
+        pool_connections=2,
+        pool_maxsize=4,
+        max_retries=Retry(total=retries, backoff_factor=0.3)
+    )
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    if user_agent:
+        session.headers['User-Agent'] = user_agent
+    return session
@@ -4,10 +4,30 @@ import ctypes
 import os
 import subprocess
 import sys
+from collections import deque
+from functools import lru_cache
 from pathlib import Path
 from typing import Callable, Optional
 
 
+# すべてのインストールに共通するオプション
+_BASE_INSTALL_ARGS = (
+    "Include_test=0",  # テストスイートは不要
+    "Include_doc=0",   # ドキュメントは不要
+    "Include_launcher=1",  # py launcherをインストール
+    "InstallLauncherAllUsers=1",
+)
+
+
+@lru_cache(maxsize=1)
+def _is_admin() -> bool:
+    """管理者権限で実行されているか確認（プロセス中は変わらないため結果をキャッシュ）"""
+    try:
+        return ctypes.windll.shell32.IsUserAnAdmin() != 0
+    except Exception:
+        return False
+
+
 class InstallError(Exception):
     """インストールエラー"""
     pass
@@ -16,16 +36,16 @@ class InstallError(Exception):
 class Installer:
     """Pythonをインストールするクラス"""
 
+    # エラーメッセージ用に保持するインストーラー出力の行数
+    ERROR_TAIL_LINES = 20
+
     def __init__(self) -> None:
         self._process: Optional[subprocess.Popen] = None
 
     @staticmethod
     def is_admin() -> bool:
         """管理者権限で実行されているか確認"""
-        try:
-            return ctypes.windll.shell32.IsUserAnAdmin() != 0
-        except Exception:
-            return False
+        return _is_admin()
 
     @staticmethod
     def request_admin_elevation() -> bool:
@@ -76,63 +96,60 @@ class Installer:
         Raises:
             InstallError: インストール失敗時
         """
-        if not installer_path.exists():
-            raise InstallError(f"インストーラーが見つかりません: {installer_path}")
+        # 全ユーザー向けインストール（管理者権限が必要）
+        if install_for_all_users and not self.is_admin():
+            raise InstallError("全ユーザー向けインストールには管理者権限が必要です")
 
         # インストールオプションを構築
-        args = [str(installer_path)]
-
-        if silent:
-            args.append("/quiet")
-        else:
-            args.append("/passive")  # プログレスバーのみ表示
-
-        # PATHに追加
-        if add_to_path:
-            args.append("PrependPath=1")
-
-        # 全ユーザー向けインストール（管理者権限が必要）
-        if install_for_all_users:
-            if not self.is_admin():
-                raise InstallError("全ユーザー向けインストールには管理者権限が必要です")
-            args.append("InstallAllUsers=1")
-        else:
-            args.append("InstallAllUsers=0")
-
-        # その他のオプション
-        args.extend([
-            "Include_test=0",  # テストスイートは不要
-            "Include_doc=0",   # ドキュメントは不要
-            "Include_launcher=1",  # py launcherをインストール
-            "InstallLauncherAllUsers=1",
-        ])
+        # （ファイルの存在確認は事前に行わず、Popen の FileNotFoundError で判定する）
+        args = [
+            str(installer_path),
+            "/quiet" if silent else "/passive",  # passive はプログレスバーのみ表示
+            *(("PrependPath=1",) if add_to_path else ()),  # PATHに追加
+            "InstallAllUsers=1" if install_for_all_users else "InstallAllUsers=0",
+            *_BASE_INSTALL_ARGS,
+        ]
 
         if progress_callback:
             progress_callback("インストーラーを起動しています...")
 
         try:
             # インストーラーを実行
+            # 標準出力は使わないため捨て、標準エラーは逐次読み出す
             self._process = subprocess.Popen(
                 args,
-                stdout=subprocess.PIPE,
+                stdout=subprocess.DEVNULL,
                 stderr=subprocess.PIPE,
-                creationflags=subprocess.CREATE_NO_WINDOW if silent else 0
+                # インストーラーのUIはコンソールではないため、コンソールを割り当てない
+                creationflags=subprocess.CREATE_NO_WINDOW | subprocess.CREATE_NEW_PROCESS_GROUP
             )
 
             if progress_callback:
                 progress_callback("インストール中...")
 
-            # 完了を待機
-            stdout, stderr = self._process.communicate()
+            # 完了まで出力を1行ずつ通知（エラー表示用に末尾の数行だけ保持）
+            error_tail: deque[str] = deque(maxlen=self.ERROR_TAIL_LINES)
+            for raw_line in iter(self._process.stderr.readline, b''):
+                line = raw_line.decode('utf-8', errors='ignore').rstrip()
+                if not line:
+                    continue
+                error_tail.append(line)
+                if progress_callback:
+                    progress_callback(line)
+
+            self._process.stderr.close()
+            self._process.wait()
 
             if self._process.returncode == 0:
                 if progress_callback:
                     progress_callback("インストールが完了しました")
                 return True
             else:
-                error_msg = stderr.decode('utf-8', errors='ignore') if stderr else "不明なエラー"
+                error_msg = "\n".join(error_tail) if error_tail else "不明なエラー"
                 raise InstallError(f"インストールに失敗しました (code: {self._process.returncode}): {error_msg}")
 
+        except FileNotFoundError as e:
+            raise InstallError(f"インストーラーが見つかりません: {installer_path}") from e
         except subprocess.SubprocessError as e:
             raise InstallError(f"インストーラーの実行に失敗しました: {e}") from e
 
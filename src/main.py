@@ -4,17 +4,21 @@ import sys
 
 from PyQt6.QtWidgets import QApplication
 
-from gui import MainWindow
-
 
 def main() -> int:
     """アプリケーションのエントリーポイント"""
     app = QApplication(sys.argv)
+
+    # GUI モジュールは QApplication 作成後に読み込む
+    from gui import MainWindow
+    from gui.styles import APP_QSS
+
     app.setApplicationName("Python AutoUpdate")
     app.setApplicationVersion("1.0.0")
 
     # ハイDPIサポート
     app.setStyle("Fusion")
+    app.setStyleSheet(APP_QSS)
 
     window = MainWindow()
     window.show()
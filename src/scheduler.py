@@ -3,29 +3,43 @@
 from datetime import datetime, time, timedelta
 from typing import Callable, Optional
 
-from PyQt6.QtCore import QObject, QTimer, pyqtSignal
+from PyQt6.QtCore import QObject, Qt, QTimer, pyqtSignal
+
+try:
+    from .utils import today_str_cached
+except ImportError:
+    from utils import today_str_cached
+
+
+_ONE_DAY = timedelta(days=1)
 
 
 class UpdateScheduler(QObject):
     """定時アップデートをスケジュールするクラス"""
 
+    # タイマーの最大待ち時間（6時間）。時計の変更やスリープ復帰に備え、
+    # 次回チェックまでが長い場合もこの間隔で予定を計算し直す
+    MAX_TIMER_INTERVAL_MS = 6 * 60 * 60 * 1000
+
     # シグナル
     scheduled_check_triggered = pyqtSignal()  # 定時チェックがトリガーされた
     next_check_updated = pyqtSignal(str)  # 次回チェック時刻が更新された
 
     def __init__(self, parent: Optional[QObject] = None) -> None:
         super().__init__(parent)
+        # 次回チェック日時まで待つ単発タイマー（発火ごとに再設定）
         self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        # 長時間のタイマーでも誤差が大きくならないよう高精度タイマーを使う
+        self._timer.setTimerType(Qt.TimerType.PreciseTimer)
         self._timer.timeout.connect(self._on_timer_timeout)
+        self._next_fire: Optional[datetime] = None
         self._scheduled_time: Optional[time] = None
+        # 定時時刻の0時からの経過秒数（次回チェック日時の計算用）
+        self._scheduled_secs = 0
         self._enabled = False
         self._last_check_date: Optional[str] = None
 
-        # 1分ごとに時刻をチェック
-        self._check_timer = QTimer(self)
-        self._check_timer.timeout.connect(self._check_scheduled_time)
-        self._check_timer.setInterval(60 * 1000)  # 60秒
-
     @property
     def is_enabled(self) -> bool:
         """スケジューラーが有効かどうか"""
@@ -43,14 +57,20 @@ class UpdateScheduler(QObject):
             return None
 
         now = datetime.now()
-        today_scheduled = datetime.combine(now.date(), self._scheduled_time)
+        now_secs = now.hour * 3600 + now.minute * 60 + now.second
+        today_scheduled = now.replace(
+            hour=self._scheduled_time.hour,
+            minute=self._scheduled_time.minute,
+            second=0,
+            microsecond=0
+        )
 
         # 今日の定時がまだ来ていない、かつ今日チェックしていない場合
-        if now < today_scheduled and self._last_check_date != now.strftime("%Y-%m-%d"):
+        if now_secs < self._scheduled_secs and self._last_check_date != today_str_cached():
             return today_scheduled
 
         # 明日の定時
-        return today_scheduled + timedelta(days=1)
+        return today_scheduled + _ONE_DAY
 
     def set_scheduled_time(self, time_str: str) -> None:
         """
@@ -62,51 +82,60 @@ class UpdateScheduler(QObject):
         try:
             hour, minute = map(int, time_str.split(":"))
             self._scheduled_time = time(hour=hour, minute=minute)
+            self._scheduled_secs = hour * 3600 + minute * 60
+            self._schedule_next()
             self._update_next_check_signal()
         except (ValueError, AttributeError):
             self._scheduled_time = time(hour=9, minute=0)
+            self._scheduled_secs = 9 * 3600
+            self._schedule_next()
 
     def set_last_check_date(self, date_str: str) -> None:
         """最後のチェック日を設定"""
         self._last_check_date = date_str
+        self._schedule_next()
 
     def start(self) -> None:
         """スケジューラーを開始"""
         self._enabled = True
-        self._check_timer.start()
+        self._schedule_next()
         self._update_next_check_signal()
 
     def stop(self) -> None:
         """スケジューラーを停止"""
         self._enabled = False
-        self._check_timer.stop()
+        self._next_fire = None
         self._timer.stop()
 
-    def _check_scheduled_time(self) -> None:
-        """定時時刻をチェック"""
-        if not self._enabled or not self._scheduled_time:
+    def _schedule_next(self) -> None:
+        """次回チェック日時にタイマーを設定"""
+        next_dt = self.next_check_datetime
+        self._next_fire = next_dt
+        if next_dt is None:
+            self._timer.stop()
             return
 
-        now = datetime.now()
-        current_time = now.time()
-        today_str = now.strftime("%Y-%m-%d")
+        delta_ms = int((next_dt - datetime.now()).total_seconds() * 1000)
+        self._timer.start(min(max(delta_ms, 0), self.MAX_TIMER_INTERVAL_MS))
 
-        # 今日既にチェック済みならスキップ
-        if self._last_check_date == today_str:
+    def _on_timer_timeout(self) -> None:
+        """タイマータイムアウト時（定時時刻に到達）"""
+        if not self._enabled or self._next_fire is None:
             return
 
-        # 定時時刻を過ぎたかチェック（1分の誤差許容）
-        scheduled_minutes = self._scheduled_time.hour * 60 + self._scheduled_time.minute
-        current_minutes = current_time.hour * 60 + current_time.minute
+        now = datetime.now()
+        today_str = today_str_cached()
 
-        if current_minutes >= scheduled_minutes and current_minutes < scheduled_minutes + 2:
-            self._last_check_date = today_str
-            self.scheduled_check_triggered.emit()
-            self._update_next_check_signal()
+        # 予定時刻前の発火（最大待ち時間での区切り・時計の変更）や
+        # 今日チェック済みの場合は再設定のみ
+        if now < self._next_fire or self._last_check_date == today_str:
+            self._schedule_next()
+            return
 
-    def _on_timer_timeout(self) -> None:
-        """タイマータイムアウト時"""
+        self._last_check_date = today_str
         self.scheduled_check_triggered.emit()
+        self._schedule_next()
+        self._update_next_check_signal()
 
     def _update_next_check_signal(self) -> None:
         """次回チェック時刻のシグナルを発行"""
@@ -118,7 +147,8 @@ class UpdateScheduler(QObject):
 
     def trigger_now(self) -> None:
         """今すぐチェックをトリガー"""
-        today_str = datetime.now().strftime("%Y-%m-%d")
+        today_str = today_str_cached()
         self._last_check_date = today_str
         self.scheduled_check_triggered.emit()
+        self._schedule_next()
         self._update_next_check_signal()
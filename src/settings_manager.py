@@ -1,13 +1,20 @@
 """設定管理クラス"""
 
 import json
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, fields
 from pathlib import Path
 from typing import Optional
 import os
+import threading
 
+from PyQt6.QtCore import QCoreApplication, QThread, QTimer
 
-@dataclass
+
+# 設定変更をまとめて書き込むまでの待ち時間（ミリ秒）
+SAVE_DEBOUNCE_MS = 200
+
+
+@dataclass(slots=True)
 class AppSettings:
     """アプリケーション設定"""
     # 自動アップデート設定
@@ -24,6 +31,19 @@ class AppSettings:
     # 最後のチェック日時
     last_check_date: str = ""
 
+    # 前回のバージョンチェック結果（キャッシュ）
+    cached_latest_version: str = ""
+    cached_download_url: str = ""
+    cached_checked_at: float = 0.0  # UNIX時刻
+
+
+# 保存時に参照する設定項目名（入れ子のデータクラスは無いため asdict の再帰コピーは不要）
+_SETTINGS_FIELD_NAMES = tuple(f.name for f in fields(AppSettings))
+
+# 既定値の設定とそのJSON（既定値のまま保存する場合はシリアライズを省略）
+_DEFAULT_SETTINGS = AppSettings()
+_DEFAULT_JSON_BYTES = json.dumps(asdict(_DEFAULT_SETTINGS), indent=2, ensure_ascii=False).encode('utf-8')
+
 
 class SettingsManager:
     """設定を管理するクラス"""
@@ -40,6 +60,16 @@ class SettingsManager:
         self._settings_file = self._settings_dir / "settings.json"
         self._settings: AppSettings = self._load_settings()
 
+        # レジストリへの自動起動登録で使うコマンドと、このセッションで反映済みの状態
+        self._startup_exe_path: Optional[str] = None
+        self._startup_applied: Optional[bool] = None
+
+        # 連続した設定変更を1回の書き込みにまとめるための遅延保存タイマー
+        # （タイマーはGUIスレッドでのみ作成・操作する）
+        self._dirty = False
+        self._flush_timer: Optional[QTimer] = None
+        self._write_lock = threading.Lock()
+
     @property
     def settings(self) -> AppSettings:
         """現在の設定を取得"""
@@ -63,41 +93,113 @@ class SettingsManager:
         return AppSettings()
 
     def save_settings(self) -> None:
+        """
+        設定の保存を予約
+
+        短時間に続く変更は SAVE_DEBOUNCE_MS 後の1回の書き込みにまとめる。
+        イベントループが無い場合やGUIスレッド以外から呼ばれた場合は即座に保存する。
+        """
+        self._dirty = True
+        if not self._is_gui_thread():
+            self._do_flush()
+            return
+
+        if self._flush_timer is None:
+            self._flush_timer = QTimer()
+            self._flush_timer.setSingleShot(True)
+            self._flush_timer.timeout.connect(self._flush_pending)
+            # ログオフ等で終了処理を通らずに終了する場合も保存待ちの変更を書き込む
+            QCoreApplication.instance().aboutToQuit.connect(self._flush_pending)
+        self._flush_timer.start(SAVE_DEBOUNCE_MS)
+
+    def flush(self) -> None:
+        """予約中の保存があれば即座に書き込む"""
+        if self._flush_timer is not None and self._is_gui_thread():
+            self._flush_timer.stop()
+        self._do_flush()
+
+    @staticmethod
+    def _is_gui_thread() -> bool:
+        """イベントループを持つアプリケーションのスレッドで実行中か"""
+        app = QCoreApplication.instance()
+        return app is not None and QThread.currentThread() is app.thread()
+
+    def _flush_pending(self) -> None:
+        """保存待ちの変更を書き込む（遅延保存タイマー・アプリ終了時に呼ばれ、例外は送出しない）"""
+        try:
+            self.flush()
+        except OSError:
+            # 書き込みに失敗した変更は未保存のまま残し、次回の保存・終了時に再試行する
+            pass
+
+    def _do_flush(self) -> None:
         """設定をファイルに保存"""
-        with open(self._settings_file, 'w', encoding='utf-8') as f:
-            json.dump(asdict(self._settings), f, indent=2, ensure_ascii=False)
+        with self._write_lock:
+            if not self._dirty:
+                return
+            # 書き込み中の変更を取りこぼさないよう、内容を取り出す前に未保存フラグを下ろす
+            self._dirty = False
+            try:
+                if self._settings == _DEFAULT_SETTINGS:
+                    data = _DEFAULT_JSON_BYTES
+                else:
+                    values = {name: getattr(self._settings, name) for name in _SETTINGS_FIELD_NAMES}
+                    data = json.dumps(values, indent=2, ensure_ascii=False).encode('utf-8')
+
+                # 一時ファイルへ一括で書き込んでから置き換え、書き込み途中で壊れたファイルを残さない
+                tmp_file = self._settings_file.with_suffix('.json.tmp')
+                with open(tmp_file, 'wb', buffering=0) as f:
+                    f.write(data)
+                os.replace(tmp_file, self._settings_file)
+            except BaseException:
+                # 保存できなかった変更は未保存のまま残す
+                self._dirty = True
+                raise
 
     def update_settings(self, **kwargs) -> None:
-        """設定を更新して保存"""
+        """設定を更新して保存（値が変わった場合のみ）"""
+        changed = False
         for key, value in kwargs.items():
-            if hasattr(self._settings, key):
+            if hasattr(self._settings, key) and getattr(self._settings, key) != value:
                 setattr(self._settings, key, value)
+                changed = True
+        if changed:
+            self.save_settings()
+
+    def _set_field(self, name: str, value) -> None:
+        """設定項目を1つ更新して保存（値が変わらなければ何もしない）"""
+        if getattr(self._settings, name) == value:
+            return
+        setattr(self._settings, name, value)
         self.save_settings()
 
     def set_auto_update(self, enabled: bool) -> None:
         """自動アップデートの有効/無効を設定"""
-        self._settings.auto_update_enabled = enabled
-        self.save_settings()
+        self._set_field('auto_update_enabled', enabled)
 
     def set_scheduled_time(self, time_str: str) -> None:
         """定時時刻を設定（HH:MM形式）"""
-        self._settings.scheduled_time = time_str
-        self.save_settings()
+        self._set_field('scheduled_time', time_str)
 
     def set_auto_install(self, enabled: bool) -> None:
         """自動インストールの有効/無効を設定"""
-        self._settings.auto_install_enabled = enabled
-        self.save_settings()
+        self._set_field('auto_install_enabled', enabled)
 
     def set_include_prerelease(self, enabled: bool) -> None:
         """プレリリース版の表示設定"""
-        self._settings.include_prerelease = enabled
-        self.save_settings()
+        self._set_field('include_prerelease', enabled)
 
     def set_last_check_date(self, date_str: str) -> None:
         """最後のチェック日時を記録"""
-        self._settings.last_check_date = date_str
-        self.save_settings()
+        self._set_field('last_check_date', date_str)
+
+    def set_check_cache(self, latest_version: str, download_url: str, checked_at: float) -> None:
+        """バージョンチェック結果のキャッシュを記録"""
+        self.update_settings(
+            cached_latest_version=latest_version,
+            cached_download_url=download_url,
+            cached_checked_at=checked_at
+        )
 
     def setup_startup(self, enable: bool) -> bool:
         """
@@ -109,6 +211,29 @@ class SettingsManager:
         Returns:
             設定成功ならTrue
         """
+        # このセッションで既に反映済みならレジストリにアクセスしない
+        if self._startup_applied != enable:
+            if not self._apply_startup_registry(enable):
+                return False
+
+        self._set_field('run_at_startup', enable)
+        try:
+            self.flush()
+        except OSError:
+            # レジストリには反映済み。設定ファイルは未保存のまま残り、次回の保存・終了時に再試行される
+            pass
+        return True
+
+    def _apply_startup_registry(self, enable: bool) -> bool:
+        """
+        自動起動のレジストリ値を登録・削除
+
+        Args:
+            enable: 登録するかどうか
+
+        Returns:
+            成功ならTrue
+        """
         try:
             import winreg
 
@@ -116,13 +241,15 @@ class SettingsManager:
             app_name = "PythonAutoUpdate"
 
             # 実行ファイルのパスを取得
-            import sys
-            if getattr(sys, 'frozen', False):
-                # PyInstallerでビルドされた場合
-                exe_path = sys.executable
-            else:
-                # 開発環境
-                exe_path = f'"{sys.executable}" "{Path(__file__).parent.parent / "run.py"}"'
+            if self._startup_exe_path is None:
+                import sys
+                if getattr(sys, 'frozen', False):
+                    # PyInstallerでビルドされた場合
+                    self._startup_exe_path = sys.executable
+                else:
+                    # 開発環境
+                    self._startup_exe_path = f'"{sys.executable}" "{Path(__file__).parent.parent / "run.py"}"'
+            exe_path = self._startup_exe_path
 
             key = winreg.OpenKey(
                 winreg.HKEY_CURRENT_USER,
@@ -131,17 +258,23 @@ class SettingsManager:
                 winreg.KEY_SET_VALUE | winreg.KEY_QUERY_VALUE
             )
 
+            # 登録済みの値と同じなら書き込まない
+            try:
+                existing, _ = winreg.QueryValueEx(key, app_name)
+            except FileNotFoundError:
+                existing = None
+
             if enable:
-                winreg.SetValueEx(key, app_name, 0, winreg.REG_SZ, exe_path)
-            else:
+                if existing != exe_path:
+                    winreg.SetValueEx(key, app_name, 0, winreg.REG_SZ, exe_path)
+            elif existing is not None:
                 try:
                     winreg.DeleteValue(key, app_name)
                 except FileNotFoundError:
                     pass  # 既に削除されている
 
             winreg.CloseKey(key)
-            self._settings.run_at_startup = enable
-            self.save_settings()
+            self._startup_applied = enable
             return True
 
         except Exception:
@@ -0,0 +1,34 @@
+"""共通のユーティリティ"""
+
+import time
+
+
+# 今日の日付文字列のキャッシュ: (今日の0時のUNIX時刻, 翌日の0時のUNIX時刻, "YYYY-MM-DD")
+# スレッド間で読み書きしても不整合にならないよう1つのタプルで保持する
+_today_cache: tuple[float, float, str] = (0.0, 0.0, "")
+
+
+def today_str_cached() -> str:
+    """
+    今日の日付を YYYY-MM-DD 形式で取得
+
+    今日の範囲（ローカル時刻の0時〜翌日0時）を保持し、その間は time.time() との比較だけで
+    前回の文字列を返す。範囲は mktime で求めるため夏時間の切り替えがあってもずれない。
+
+    Returns:
+        今日の日付文字列
+    """
+    global _today_cache
+
+    now = time.time()
+    day_start, day_end, today = _today_cache
+    if day_start <= now < day_end:
+        return today
+
+    local = time.localtime(now)
+    today = time.strftime("%Y-%m-%d", local)
+    # mktime は日の繰り上がり（月末の +1 日など）を正規化する
+    day_start = time.mktime((local.tm_year, local.tm_mon, local.tm_mday, 0, 0, 0, 0, 0, -1))
+    day_end = time.mktime((local.tm_year, local.tm_mon, local.tm_mday + 1, 0, 0, 0, 0, 0, -1))
+    _today_cache = (day_start, day_end, today)
+    return today
@@ -1,21 +1,83 @@
 """Pythonバージョンチェック機能"""
 
+import ctypes
 import re
 import subprocess
 import sys
-from dataclasses import dataclass
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
 from typing import Optional
 
 import requests
-from packaging import version
 
+try:
+    from .http_client import create_session
+except ImportError:
+    from http_client import create_session
+
+
+# ダウンロードページの最新バージョン表記（例: "Download Python 3.12.1"、デコードせずバイト列のまま検索）
+_PY_DL_RE = re.compile(rb'Download Python (\d+)\.(\d+)\.(\d+)')
+# ダウンロードページを読み進める単位と、チャンク境界をまたぐ一致のために残す末尾の長さ
+_DOWNLOADS_PAGE_CHUNK_SIZE = 4096
+_DOWNLOADS_PAGE_OVERLAP = 64
+# 見つからない場合に読み込むページの上限（バイト数）
+_DOWNLOADS_PAGE_MAX_BYTES = 1024 * 1024
+# py launcher のパス一覧出力の各行（例: " -V:3.12 *        C:\Python312\python.exe"）
+_PY_LAUNCHER_PATH_RE = re.compile(r'-V:(\d+)\.(\d+)\S*\s+(?:\*\s+)?(\S.*?)\s*$', re.MULTILINE)
+# PEP 514 のレジストリに登録されたバージョンタグ（例: "3.12", "3.12-32"）
+_PY_REGISTRY_TAG_RE = re.compile(r'(\d+)\.(\d+)')
+# include/patchlevel.h のパッチバージョン定義
+_PY_MICRO_VERSION_RE = re.compile(r'^#define\s+PY_MICRO_VERSION\s+(\d+)', re.MULTILINE)
+
+
+def _read_exe_micro_version(exe_path: str) -> Optional[int]:
+    """
+    python.exe のバージョンリソース（VERSIONINFO）からパッチバージョンを取得
+
+    ファイルバージョンの3番目の値は micro * 1000 + リリースレベル * 10 + シリアル番号
+    （例: 3.12.7 → 3.12.7150.1013）になっている。
+
+    Args:
+        exe_path: python.exe のパス
+
+    Returns:
+        パッチバージョン、取得失敗時はNone
+    """
+    try:
+        version_dll = ctypes.windll.version
+        size = version_dll.GetFileVersionInfoSizeW(exe_path, None)
+        if not size:
+            return None
+        buffer = ctypes.create_string_buffer(size)
+        if not version_dll.GetFileVersionInfoW(exe_path, 0, size, buffer):
+            return None
+
+        info = ctypes.c_void_p()
+        length = ctypes.c_uint()
+        if not version_dll.VerQueryValueW(buffer, "\\", ctypes.byref(info), ctypes.byref(length)):
+            return None
+
+        # VS_FIXEDFILEINFO: dwSignature, dwStrucVersion, dwFileVersionMS, dwFileVersionLS, ...
+        file_version_ls = ctypes.cast(info, ctypes.POINTER(ctypes.c_uint32))[3]
+        return (file_version_ls >> 16) // 1000
+    except Exception:
+        return None
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class PythonVersion:
-    """Pythonバージョン情報"""
+    """Pythonバージョン情報（不変・ハッシュ可能）"""
     major: int
     minor: int
     patch: int
+    # 大小比較用に (major, minor, patch) を1つの整数に詰めた値
+    _packed: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, '_packed', (self.major << 24) | (self.minor << 12) | self.patch)
 
     @property
     def version_string(self) -> str:
@@ -27,6 +89,23 @@ class PythonVersion:
     def to_tuple(self) -> tuple[int, int, int]:
         return (self.major, self.minor, self.patch)
 
+    @classmethod
+    def from_string(cls, version_string: str) -> Optional["PythonVersion"]:
+        """
+        "X.Y.Z" 形式の文字列からバージョンを生成
+
+        Args:
+            version_string: バージョン文字列
+
+        Returns:
+            PythonVersion、形式が不正ならNone
+        """
+        try:
+            major, minor, patch = map(int, version_string.split("."))
+        except (ValueError, AttributeError):
+            return None
+        return cls(major=major, minor=minor, patch=patch)
+
 
 class VersionChecker:
     """Pythonバージョンをチェックするクラス"""
@@ -34,11 +113,30 @@ class VersionChecker:
     # Python公式サイトのAPIエンドポイント
     PYTHON_API_URL = "https://www.python.org/api/v2/downloads/release/"
     PYTHON_DOWNLOADS_URL = "https://www.python.org/downloads/"
+    # リリースサイクルごとの最新バージョンを返す軽量なJSON API
+    PYTHON_RELEASES_API_URL = "https://endoflife.date/api/python.json"
+
+    # 最新バージョンの取得結果を再利用する期間（秒）
+    LATEST_VERSION_TTL = 60 * 60
 
-    def __init__(self) -> None:
+    # 取得失敗時は別の取得元へフォールバックするため、再試行は控えめにする
+    MAX_RETRIES = 2
+
+    def __init__(self, session: Optional[requests.Session] = None) -> None:
+        """
+        Args:
+            session: 使用するHTTPセッション（Noneの場合は新規作成）
+        """
+        self._session = session if session is not None else create_session(retries=self.MAX_RETRIES)
         self._latest_version: Optional[PythonVersion] = None
+        self._latest_fetched_at = 0.0
         self._download_url: Optional[str] = None
 
+        # 条件付きGET用（前回のAPI応答の検証子と、その時の結果）
+        self._api_etag: Optional[str] = None
+        self._api_last_modified: Optional[str] = None
+        self._api_latest: Optional[PythonVersion] = None
+
     def get_installed_version(self) -> Optional[PythonVersion]:
         """
         現在インストールされているPythonのバージョンを取得
@@ -62,32 +160,17 @@ class VersionChecker:
         """
         versions: list[PythonVersion] = []
 
-        # py launcherを使用してインストール済みバージョンを取得
         try:
-            result = subprocess.run(
-                ["py", "--list"],
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
-            if result.returncode == 0:
-                # 出力からバージョンを抽出
-                # 例: " -V:3.12 *        Python 3.12 (64-bit)"
-                pattern = r"-V:(\d+)\.(\d+)"
-                for match in re.finditer(pattern, result.stdout):
-                    major, minor = int(match.group(1)), int(match.group(2))
-                    # パッチバージョンを取得するために詳細情報を取得
-                    try:
-                        detail_result = subprocess.run(
-                            ["py", f"-{major}.{minor}", "-c", "import sys; print(sys.version_info.micro)"],
-                            capture_output=True,
-                            text=True,
-                            timeout=10
-                        )
-                        patch = int(detail_result.stdout.strip()) if detail_result.returncode == 0 else 0
-                    except Exception:
-                        patch = 0
-                    versions.append(PythonVersion(major=major, minor=minor, patch=patch))
+            # レジストリから直接列挙し、見つからない場合のみpy launcherを使用
+            entries = self._find_installations_in_registry() or self._find_installations_with_launcher()
+            if entries:
+                # パッチバージョンの取得はインタープリターごとに並列で行う
+                with ThreadPoolExecutor(max_workers=min(8, len(entries))) as executor:
+                    patches = list(executor.map(self._detect_patch, entries))
+                versions.extend(
+                    PythonVersion(major=major, minor=minor, patch=patch)
+                    for (major, minor, _), patch in zip(entries, patches)
+                )
         except FileNotFoundError:
             # py launcherがない場合は現在のPythonのみ
             current = self.get_installed_version()
@@ -98,35 +181,241 @@ class VersionChecker:
 
         return versions
 
-    def get_latest_version(self) -> Optional[PythonVersion]:
+    @staticmethod
+    def _find_installations_in_registry() -> list[tuple[int, int, str]]:
+        """
+        レジストリ（PEP 514）からインストール済みPythonを列挙
+
+        Returns:
+            (major, minor, 実行ファイルのパス) のリスト
+        """
+        try:
+            import winreg
+        except ImportError:
+            return []
+
+        python_core_keys = (
+            (winreg.HKEY_CURRENT_USER, r"Software\Python\PythonCore"),
+            (winreg.HKEY_LOCAL_MACHINE, r"Software\Python\PythonCore"),
+            (winreg.HKEY_LOCAL_MACHINE, r"Software\WOW6432Node\Python\PythonCore"),
+        )
+
+        entries: list[tuple[int, int, str]] = []
+        seen: set[str] = set()
+        for hive, key_path in python_core_keys:
+            try:
+                root = winreg.OpenKey(hive, key_path)
+            except OSError:
+                continue
+
+            with root:
+                for i in range(winreg.QueryInfoKey(root)[0]):
+                    tag = winreg.EnumKey(root, i)
+                    match = _PY_REGISTRY_TAG_RE.match(tag)
+                    if not match:
+                        continue
+
+                    try:
+                        with winreg.OpenKey(root, tag + r"\InstallPath") as install_key:
+                            try:
+                                exe_path = winreg.QueryValueEx(install_key, "ExecutablePath")[0]
+                            except OSError:
+                                # 古いインストーラーは既定値（インストール先）のみ登録している
+                                install_dir = winreg.QueryValueEx(install_key, "")[0]
+                                exe_path = str(Path(install_dir) / "python.exe")
+                    except OSError:
+                        continue
+
+                    if exe_path.lower() in seen:
+                        continue
+                    seen.add(exe_path.lower())
+                    entries.append((int(match.group(1)), int(match.group(2)), exe_path))
+
+        return entries
+
+    @staticmethod
+    def _find_installations_with_launcher() -> list[tuple[int, int, str]]:
+        """
+        py launcher のパス一覧からインストール済みPythonを列挙
+
+        Returns:
+            (major, minor, 実行ファイルのパス) のリスト
+
+        Raises:
+            FileNotFoundError: py launcherがない場合
+        """
+        result = subprocess.run(
+            ["py", "--list-paths"],
+            capture_output=True,
+            text=True,
+            timeout=10
+        )
+        if result.returncode != 0:
+            return []
+
+        # 出力からバージョンと実行ファイルのパスを抽出
+        return [
+            (int(match.group(1)), int(match.group(2)), match.group(3))
+            for match in _PY_LAUNCHER_PATH_RE.finditer(result.stdout)
+        ]
+
+    @classmethod
+    def _detect_patch(cls, entry: tuple[int, int, str]) -> int:
+        """
+        インストール先の patchlevel.h からパッチバージョンを取得
+
+        ヘッダーが無い場合は python.exe のバージョンリソースを読み、
+        それも取得できない場合のみインタープリターを起動して取得する。
+
+        Args:
+            entry: (major, minor, 実行ファイルのパス)
+
+        Returns:
+            パッチバージョン、取得失敗時は0
+        """
+        major, minor, exe_path = entry
+        patchlevel_h = Path(exe_path).parent / "include" / "patchlevel.h"
+        try:
+            match = _PY_MICRO_VERSION_RE.search(patchlevel_h.read_text(encoding='utf-8', errors='replace'))
+        except OSError:
+            match = None
+        if match:
+            return int(match.group(1))
+
+        patch = _read_exe_micro_version(exe_path)
+        if patch is not None:
+            return patch
+        return cls._probe_patch((major, minor))
+
+    @staticmethod
+    def _probe_patch(pair: tuple[int, int]) -> int:
+        """
+        py launcher経由で指定バージョンのパッチバージョンを取得
+
+        Args:
+            pair: (major, minor)
+
+        Returns:
+            パッチバージョン、取得失敗時は0
+        """
+        major, minor = pair
+        try:
+            result = subprocess.run(
+                ["py", f"-{major}.{minor}", "-c", "import sys; print(sys.version_info.micro)"],
+                capture_output=True,
+                text=True,
+                timeout=10
+            )
+            return int(result.stdout.strip()) if result.returncode == 0 else 0
+        except Exception:
+            return 0
+
+    def get_latest_version(self, force: bool = False) -> Optional[PythonVersion]:
         """
         Python公式サイトから最新の安定版バージョンを取得
 
+        Args:
+            force: 有効期間内の取得結果を使わずにネットワークから取得する
+
+        Returns:
+            最新のPythonバージョン、取得失敗時はNone
+        """
+        if (not force and self._latest_version is not None
+                and time.monotonic() - self._latest_fetched_at < self.LATEST_VERSION_TTL):
+            return self._latest_version
+
+        # 軽量なJSON APIを優先し、失敗した場合はダウンロードページから取得
+        latest = self._fetch_latest_from_api() or self._fetch_latest_from_downloads_page()
+        if latest:
+            self._latest_version = latest
+            self._latest_fetched_at = time.monotonic()
+        return latest
+
+    def _fetch_latest_from_api(self) -> Optional[PythonVersion]:
+        """
+        リリース情報のJSON APIから最新の安定版バージョンを取得
+
         Returns:
             最新のPythonバージョン、取得失敗時はNone
         """
+        # 前回の応答から変わっていなければ本文なしの304が返る
+        headers = {}
+        if self._api_latest is not None:
+            if self._api_etag:
+                headers['If-None-Match'] = self._api_etag
+            if self._api_last_modified:
+                headers['If-Modified-Since'] = self._api_last_modified
+
         try:
-            # Python.orgのダウンロードページをスクレイピング
-            response = requests.get(self.PYTHON_DOWNLOADS_URL, timeout=30)
+            response = self._session.get(self.PYTHON_RELEASES_API_URL, headers=headers, timeout=10)
+            if response.status_code == 304 and self._api_latest is not None:
+                return self._api_latest
             response.raise_for_status()
 
-            # 最新バージョンを抽出（例: "Download Python 3.12.1"）
-            pattern = r'Download Python (\d+)\.(\d+)\.(\d+)'
-            match = re.search(pattern, response.text)
+            # 例: [{"cycle": "3.12", "latest": "3.12.1", ...}, ...]
+            versions = (
+                PythonVersion.from_string(cycle.get("latest", ""))
+                for cycle in response.json()
+            )
+            latest = max((v for v in versions if v), key=PythonVersion.to_tuple, default=None)
 
-            if match:
-                self._latest_version = PythonVersion(
-                    major=int(match.group(1)),
-                    minor=int(match.group(2)),
-                    patch=int(match.group(3))
-                )
-                return self._latest_version
+            if latest:
+                self._api_etag = response.headers.get('ETag')
+                self._api_last_modified = response.headers.get('Last-Modified')
+                self._api_latest = latest
+            return latest
+
+        except (requests.RequestException, ValueError, TypeError, AttributeError):
+            return None
+
+    def _fetch_latest_from_downloads_page(self) -> Optional[PythonVersion]:
+        """
+        Python.orgのダウンロードページをスクレイピングして最新の安定版バージョンを取得
+
+        Returns:
+            最新のPythonバージョン、取得失敗時はNone
+        """
+        try:
+            # 最新バージョンの表記はページ先頭付近にあるため、見つかった時点で読み込みを打ち切る
+            with self._session.get(self.PYTHON_DOWNLOADS_URL, timeout=30, stream=True) as response:
+                response.raise_for_status()
+
+                buffer = b""
+                read_bytes = 0
+                for chunk in response.iter_content(_DOWNLOADS_PAGE_CHUNK_SIZE):
+                    buffer += chunk
+                    match = _PY_DL_RE.search(buffer)
+                    # 一致がバッファ末尾で終わる場合は数字が次のチャンクへ続く可能性があるため確定しない
+                    if match and match.end() < len(buffer):
+                        return self._version_from_match(match)
+
+                    read_bytes += len(chunk)
+                    if read_bytes >= _DOWNLOADS_PAGE_MAX_BYTES:
+                        return None
+                    keep_from = len(buffer) - _DOWNLOADS_PAGE_OVERLAP
+                    if match:
+                        keep_from = min(keep_from, match.start())
+                    buffer = buffer[max(keep_from, 0):]
+
+                # ページの終端まで読んだ場合は末尾の一致も確定してよい
+                match = _PY_DL_RE.search(buffer)
+                if match:
+                    return self._version_from_match(match)
 
             return None
 
         except requests.RequestException:
             return None
 
+    @staticmethod
+    def _version_from_match(match: "re.Match[bytes]") -> PythonVersion:
+        """ダウンロードページの正規表現の一致からバージョンを生成"""
+        return PythonVersion(
+            major=int(match.group(1)),
+            minor=int(match.group(2)),
+            patch=int(match.group(3))
+        )
+
     def get_download_url(self, target_version: Optional[PythonVersion] = None) -> Optional[str]:
         """
         指定バージョンのWindowsインストーラーのダウンロードURLを取得
@@ -146,18 +435,11 @@ class VersionChecker:
 
         # Windows用64bitインストーラーのURL
         # 例: https://www.python.org/ftp/python/3.12.1/python-3.12.1-amd64.exe
+        # URLの形式は決まっているため事前の存在確認は行わず、
+        # ファイルが無い場合はダウンロード時のエラーとして扱う
         url = f"https://www.python.org/ftp/python/{ver.version_string}/python-{ver.version_string}-amd64.exe"
-
-        # URLが有効か確認
-        try:
-            response = requests.head(url, timeout=10, allow_redirects=True)
-            if response.status_code == 200:
-                self._download_url = url
-                return url
-        except requests.RequestException:
-            pass
-
-        return None
+        self._download_url = url
+        return url
 
     def is_update_available(self, installed: PythonVersion, latest: PythonVersion) -> bool:
         """
@@ -170,19 +452,22 @@ class VersionChecker:
         Returns:
             アップデートが利用可能ならTrue
         """
-        installed_ver = version.parse(installed.version_string)
-        latest_ver = version.parse(latest.version_string)
-        return latest_ver > installed_ver
+        return latest._packed > installed._packed
 
-    def check_for_updates(self) -> tuple[Optional[PythonVersion], Optional[PythonVersion], bool]:
+    def check_for_updates(
+        self, force: bool = False
+    ) -> tuple[Optional[PythonVersion], Optional[PythonVersion], bool]:
         """
         アップデートをチェック
 
+        Args:
+            force: 最新バージョンの取得結果を使わずにネットワークから取得する
+
         Returns:
             (インストール済みバージョン, 最新バージョン, アップデート可能か)
         """
         installed = self.get_installed_version()
-        latest = self.get_latest_version()
+        latest = self.get_latest_version(force=force)
 
         if installed and latest:
             update_available = self.is_update_available(installed, latest)
@@ -0,0 +1,23 @@
+"""テスト共通設定"""
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+# run.py と同様に src ディレクトリをパスに追加
+src_dir = Path(__file__).parent.parent / "src"
+sys.path.insert(0, str(src_dir))
+
+# 画面の無い環境でもQtを使えるようにする
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+
+@pytest.fixture(scope="session")
+def qapp():
+    """テスト全体で共有する QCoreApplication"""
+    from PyQt6.QtCore import QCoreApplication
+
+    app = QCoreApplication.instance() or QCoreApplication([])
+    yield app
@@ -0,0 +1,163 @@
+"""Downloader のテスト"""
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+
+from downloader import Downloader, DownloadError
+from http_client import create_session
+from version_checker import PythonVersion
+
+
+PAYLOAD = bytes(range(256)) * 4096  # 1MB
+VERSION = PythonVersion(3, 12, 10)
+INSTALLER_NAME = "python-3.12.10-amd64.exe"
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """テスト用のダウンロードサーバー（挙動はサーバーの属性で切り替える）"""
+
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args) -> None:
+        pass
+
+    def _send_headers(self, status: int, length: int, content_range: str = "") -> None:
+        self.send_response(status)
+        self.send_header("Content-Length", str(length))
+        if self.server.accept_ranges:
+            self.send_header("Accept-Ranges", "bytes")
+        if content_range:
+            self.send_header("Content-Range", content_range)
+        self.end_headers()
+
+    def do_HEAD(self) -> None:
+        if self.server.status != 200:
+            self._send_headers(self.server.status, 0)
+            return
+        self._send_headers(200, len(PAYLOAD))
+
+    def do_GET(self) -> None:
+        self.server.range_requests += "Range" in self.headers
+        if self.server.status != 200:
+            self._send_headers(self.server.status, 0)
+            return
+
+        range_header = self.headers.get("Range")
+        if range_header and self.server.honor_range:
+            start, end = (int(v) for v in range_header.split("=")[1].split("-"))
+            self._send_headers(206, end - start + 1, f"bytes {start}-{end}/{len(PAYLOAD)}")
+            self.wfile.write(PAYLOAD[start:end + 1])
+            return
+
+        self._send_headers(200, len(PAYLOAD))
+        if self.server.truncate:
+            # Content-Length より短い本文で接続を切る
+            self.wfile.write(PAYLOAD[:len(PAYLOAD) // 2])
+            self.close_connection = True
+            return
+        self.wfile.write(PAYLOAD)
+
+
+@pytest.fixture
+def server() -> Iterator[ThreadingHTTPServer]:
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    httpd.daemon_threads = True
+    httpd.accept_ranges = True
+    httpd.honor_range = True
+    httpd.status = 200
+    httpd.truncate = False
+    httpd.range_requests = 0
+    thread = threading.Thread(target=httpd.serve_forever, args=(0.05,), daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def _url(httpd: ThreadingHTTPServer) -> str:
+    return f"http://127.0.0.1:{httpd.server_address[1]}/{INSTALLER_NAME}"
+
+
+def _downloader() -> Downloader:
+    """セグメント分割されるよう最小サイズを小さくした Downloader を作成"""
+    downloader = Downloader(session=create_session(retries=0))
+    downloader.SEGMENT_MIN_SIZE = 64 * 1024
+    return downloader
+
+
+def test_segmented_download_assembles_file(server, tmp_path: Path) -> None:
+    """Range対応サーバーからセグメントごとに取得したファイルが元の内容と一致する"""
+    progress = []
+    path = _downloader().download(
+        _url(server), VERSION, lambda done, total: progress.append((done, total)),
+        save_dir=tmp_path, chunk_size=16 * 1024
+    )
+
+    assert path == tmp_path / INSTALLER_NAME
+    assert path.read_bytes() == PAYLOAD
+    assert server.range_requests == Downloader.SEGMENT_COUNT
+    assert progress[-1] == (len(PAYLOAD), len(PAYLOAD))
+    assert not (tmp_path / (INSTALLER_NAME + ".part")).exists()
+
+
+def test_range_ignored_falls_back_to_stream(server, tmp_path: Path) -> None:
+    """Accept-Ranges を返すがRangeを無視するサーバーでは単一ストリームで取得し直す"""
+    server.honor_range = False
+
+    path = _downloader().download(_url(server), VERSION, save_dir=tmp_path, chunk_size=16 * 1024)
+
+    assert path.read_bytes() == PAYLOAD
+    assert not (tmp_path / (INSTALLER_NAME + ".part")).exists()
+
+
+def test_stream_download_without_range_support(server, tmp_path: Path) -> None:
+    """Range非対応のサーバーではRangeリクエストを送らない"""
+    server.accept_ranges = False
+
+    path = _downloader().download(_url(server), VERSION, save_dir=tmp_path, chunk_size=16 * 1024)
+
+    assert path.read_bytes() == PAYLOAD
+    assert server.range_requests == 0
+
+
+@pytest.mark.parametrize("accept_ranges", [True, False])
+def test_http_error_removes_part_file(server, tmp_path: Path, accept_ranges: bool) -> None:
+    """HTTPエラー時は DownloadError を送出し、途中ファイルを残さない"""
+    server.accept_ranges = accept_ranges
+    server.status = 404
+
+    with pytest.raises(DownloadError):
+        _downloader().download(_url(server), VERSION, save_dir=tmp_path)
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_truncated_body_removes_part_file(server, tmp_path: Path) -> None:
+    """本文が途中で切れた場合は DownloadError を送出し、途中ファイルを残さない"""
+    server.accept_ranges = False
+    server.truncate = True
+
+    with pytest.raises(DownloadError):
+        _downloader().download(_url(server), VERSION, save_dir=tmp_path, chunk_size=16 * 1024)
+
+    assert list(tmp_path.iterdir()) == []
+
+
+@pytest.mark.parametrize("accept_ranges", [True, False])
+def test_cancel_removes_part_file(server, tmp_path: Path, accept_ranges: bool) -> None:
+    """進捗通知中にキャンセルされた場合は DownloadError を送出し、ファイルを残さない"""
+    server.accept_ranges = accept_ranges
+    downloader = _downloader()
+
+    with pytest.raises(DownloadError, match="キャンセル"):
+        downloader.download(
+            _url(server), VERSION, lambda done, total: downloader.cancel(),
+            save_dir=tmp_path, chunk_size=16 * 1024
+        )
+
+    assert list(tmp_path.iterdir()) == []
+    assert downloader.download_path is None
@@ -0,0 +1,54 @@
+"""UpdateScheduler のテスト"""
+
+from datetime import datetime
+
+import pytest
+
+import scheduler
+from scheduler import UpdateScheduler
+
+
+def _scheduler_at(monkeypatch, now: datetime, scheduled: str, last_check: str) -> UpdateScheduler:
+    """現在時刻を now に固定したスケジューラーを作成"""
+
+    class _FixedDatetime(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return now
+
+    monkeypatch.setattr(scheduler, "datetime", _FixedDatetime)
+    monkeypatch.setattr(scheduler, "today_str_cached", lambda: now.strftime("%Y-%m-%d"))
+
+    sched = UpdateScheduler()
+    sched.set_scheduled_time(scheduled)
+    sched.set_last_check_date(last_check)
+    sched.start()
+    return sched
+
+
+@pytest.mark.parametrize("now, scheduled, last_check, expected", [
+    # 今日の定時を過ぎ、今日チェック済み → 翌日の定時
+    (datetime(2024, 12, 31, 23, 30), "09:00", "2024-12-31", datetime(2025, 1, 1, 9, 0)),
+    # 日付が変わった直後（前日にチェック済み）→ 今日の定時
+    (datetime(2025, 1, 1, 0, 10), "09:00", "2024-12-31", datetime(2025, 1, 1, 9, 0)),
+    # 今日の定時前でも今日チェック済み → 翌日の定時
+    (datetime(2024, 12, 31, 23, 30), "23:45", "2024-12-31", datetime(2025, 1, 1, 23, 45)),
+    # 今日の定時前で未チェック → 今日の定時
+    (datetime(2024, 12, 31, 23, 30), "23:45", "2024-12-30", datetime(2024, 12, 31, 23, 45)),
+])
+def test_next_check_datetime_across_midnight(
+    qapp, monkeypatch, now: datetime, scheduled: str, last_check: str, expected: datetime
+) -> None:
+    """日付をまたぐ場合も次回チェック日時を正しく求める"""
+    sched = _scheduler_at(monkeypatch, now, scheduled, last_check)
+
+    assert sched.next_check_datetime == expected
+    assert sched._next_fire == expected
+
+
+def test_next_check_datetime_when_stopped(qapp) -> None:
+    """停止中は次回チェック日時が無い"""
+    sched = UpdateScheduler()
+    sched.set_scheduled_time("09:00")
+
+    assert sched.next_check_datetime is None
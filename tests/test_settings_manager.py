@@ -0,0 +1,91 @@
+"""SettingsManager のテスト"""
+
+import json
+import os
+import threading
+from pathlib import Path
+
+import pytest
+
+import settings_manager
+from settings_manager import SettingsManager
+
+
+@pytest.fixture
+def manager(monkeypatch, tmp_path: Path) -> SettingsManager:
+    """一時ディレクトリに設定を保存する SettingsManager"""
+    monkeypatch.setenv("APPDATA", str(tmp_path))
+    return SettingsManager()
+
+
+def _saved(manager: SettingsManager) -> dict:
+    with open(manager.settings_dir / "settings.json", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _settings_files(manager: SettingsManager) -> list[str]:
+    return sorted(p.name for p in manager.settings_dir.iterdir())
+
+
+def test_save_is_debounced_until_flush(qapp, manager: SettingsManager) -> None:
+    """GUIスレッドでの連続した変更は flush まで書き込まれず、まとめて保存される"""
+    manager.set_auto_update(True)
+    manager.set_scheduled_time("21:30")
+
+    assert _settings_files(manager) == []
+
+    manager.flush()
+
+    saved = _saved(manager)
+    assert saved["auto_update_enabled"] is True
+    assert saved["scheduled_time"] == "21:30"
+    assert _settings_files(manager) == ["settings.json"]
+
+
+def test_save_from_worker_thread_writes_immediately(qapp, manager: SettingsManager) -> None:
+    """GUIスレッド以外からの保存は即座に書き込まれる"""
+    worker = threading.Thread(target=manager.set_last_check_date, args=("2025-01-01",))
+    worker.start()
+    worker.join()
+
+    assert _saved(manager)["last_check_date"] == "2025-01-01"
+    assert _settings_files(manager) == ["settings.json"]
+
+
+def test_flush_replaces_file_atomically(qapp, monkeypatch, manager: SettingsManager) -> None:
+    """一時ファイルに書き込んでから os.replace で置き換える"""
+    replaced = []
+    real_replace = os.replace
+
+    def _replace(src, dst):
+        replaced.append((Path(src).name, Path(dst).name))
+        real_replace(src, dst)
+
+    monkeypatch.setattr(settings_manager.os, "replace", _replace)
+    manager.set_auto_install(True)
+    manager.flush()
+
+    assert replaced == [("settings.json.tmp", "settings.json")]
+    assert _saved(manager)["auto_install_enabled"] is True
+
+
+def test_failed_replace_keeps_previous_file(qapp, monkeypatch, manager: SettingsManager) -> None:
+    """置き換えに失敗しても前回の設定ファイルは壊れず、次の flush で再試行する"""
+    manager.set_scheduled_time("10:00")
+    manager.flush()
+
+    def _fail(src, dst):
+        raise PermissionError("locked")
+
+    with monkeypatch.context() as m:
+        m.setattr(settings_manager.os, "replace", _fail)
+        manager.set_scheduled_time("11:00")
+        with pytest.raises(PermissionError):
+            manager.flush()
+
+    assert _saved(manager)["scheduled_time"] == "10:00"
+
+    manager.flush()
+
+    assert _saved(manager)["scheduled_time"] == "11:00"
+    assert "settings.json.tmp" not in _settings_files(manager)
@@ -0,0 +1,42 @@
+"""VersionChecker のテスト"""
+
+from unittest import mock
+
+import pytest
+
+import version_checker
+from version_checker import PythonVersion, VersionChecker
+
+
+def _checker_for_page(page: bytes, chunk_size: int) -> VersionChecker:
+    """ダウンロードページを chunk_size ごとに返すセッションを持つ VersionChecker を作成"""
+    session = mock.MagicMock()
+    response = session.get.return_value.__enter__.return_value
+    response.iter_content.side_effect = lambda size: (
+        page[i:i + chunk_size] for i in range(0, len(page), chunk_size)
+    )
+    return VersionChecker(session=session)
+
+
+@pytest.mark.parametrize("prefix_len", [4074, 4075, 4076, 4090])
+def test_downloads_page_version_split_by_chunk_boundary(prefix_len: int) -> None:
+    """チャンク境界がバージョン番号の途中にあっても正しく読み取る"""
+    page = b"x" * prefix_len + b"Download Python 3.12.10</a>" + b"y" * 8192
+    checker = _checker_for_page(page, version_checker._DOWNLOADS_PAGE_CHUNK_SIZE)
+
+    assert checker._fetch_latest_from_downloads_page() == PythonVersion(3, 12, 10)
+
+
+def test_downloads_page_version_at_end_of_page() -> None:
+    """ページ末尾で終わるバージョン番号も読み取る"""
+    page = b"x" * 4074 + b"Download Python 3.12.10"
+    checker = _checker_for_page(page, version_checker._DOWNLOADS_PAGE_CHUNK_SIZE)
+
+    assert checker._fetch_latest_from_downloads_page() == PythonVersion(3, 12, 10)
+
+
+def test_downloads_page_without_version() -> None:
+    """バージョン表記が無い場合はNone"""
+    checker = _checker_for_page(b"x" * 20000, version_checker._DOWNLOADS_PAGE_CHUNK_SIZE)
+
+    assert checker._fetch_latest_from_downloads_page() is None